@@ -0,0 +1,91 @@
+# numba kernels used to validate CHECK constraints on large numeric columns.  This module imports numba, so it is only imported by
+# `file_load_dataframe` the first time a column large enough for the kernels is validated and an ImportError means numba isn't installed.  The
+# kernels are compiled for their signatures when the module is imported (or loaded from numba's on disk cache), so validating a column never
+# waits on the compiler.  The kernels release the GIL so the columns swept by a thread pool are scanned in parallel.
+from __future__ import annotations
+import operator
+import types
+from numba import njit
+from numba import types as numba_types
+
+# the kernels only read the values, so they are compiled for read-only arrays which also accept writeable arrays (pandas hands out read-only
+# views of the columns under copy-on-write).  int64 columns are compared against int or float check values, float64 columns against float
+# check values (int check values are converted)
+_INT64_VALUES = numba_types.Array(numba_types.int64, 1, 'A', readonly=True)
+_FLOAT64_VALUES = numba_types.Array(numba_types.float64, 1, 'A', readonly=True)
+_SIGNATURES = {
+    'int64': [numba_types.int64(_INT64_VALUES, numba_types.int64), numba_types.int64(_INT64_VALUES, numba_types.float64)],
+    'float64': [numba_types.int64(_FLOAT64_VALUES, numba_types.float64)],
+}
+
+def _first_not_eq(values, check_value):
+    for i in range(values.shape[0]):
+        if not values[i] == check_value:
+            return i
+    return -1
+
+def _first_not_gt(values, check_value):
+    for i in range(values.shape[0]):
+        if not values[i] > check_value:
+            return i
+    return -1
+
+def _first_not_lt(values, check_value):
+    for i in range(values.shape[0]):
+        if not values[i] < check_value:
+            return i
+    return -1
+
+def _first_not_ge(values, check_value):
+    for i in range(values.shape[0]):
+        if not values[i] >= check_value:
+            return i
+    return -1
+
+def _first_not_le(values, check_value):
+    for i in range(values.shape[0]):
+        if not values[i] <= check_value:
+            return i
+    return -1
+
+def _first_not_ne(values, check_value):
+    for i in range(values.shape[0]):
+        if not values[i] != check_value:
+            return i
+    return -1
+
+_KERNEL_FUNCTIONS = {
+    operator.eq: _first_not_eq,
+    operator.gt: _first_not_gt,
+    operator.lt: _first_not_lt,
+    operator.ge: _first_not_ge,
+    operator.le: _first_not_le,
+    operator.ne: _first_not_ne,
+}
+
+# the compiled kernel for each (column dtype name, CHECK operator), each returns the position of the first value failing the check or -1
+KERNELS = types.MappingProxyType({
+    (dtype_name, check_operator): njit(signatures, cache=True, boundscheck=False, nogil=True)(kernel_function)
+    for dtype_name, signatures in _SIGNATURES.items()
+    for check_operator, kernel_function in _KERNEL_FUNCTIONS.items()
+})
+
+def first_violation(values, checks: list) -> int | None:
+    """
+    Returns the position of the first value of the int64/float64 ndarray that fails any of the (operator, check_value) checks, -1 if every value
+    passes, or None if a check has no kernel for the column dtype or the kernel has no signature for the values (e.g. a check value too large
+    for an int64) and must be validated with NumPy instead.
+    """
+    dtype_name = values.dtype.name
+    kernel_checks = []
+    for check_operator, check_value in checks:
+        kernel = KERNELS.get((dtype_name, check_operator))
+        if kernel is None:
+            return None
+        kernel_checks.append((kernel, float(check_value) if dtype_name == 'float64' else check_value))
+
+    try:
+        positions = [kernel(values, check_value) for kernel, check_value in kernel_checks]
+    except TypeError:
+        return None
+    return min((position for position in positions if position >= 0), default=-1)
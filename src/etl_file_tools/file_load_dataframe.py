@@ -1,8 +1,301 @@
 from __future__ import annotations
-import pandas as pd
+import collections.abc
+import concurrent.futures
+import contextlib
+import functools
+import importlib
+import importlib.util
+import operator
+import os
+import sys
+import types
 from typing import Literal
 from dataclasses import dataclass, field
 
+class _LazyModule:
+    """
+    Stands in for a module that is imported the first time one of its attributes is used.  pandas and numpy take most of the time it takes to
+    import this module, so they are only imported once data is read or validated (e.g. a tool that only builds constraints never imports them).
+    """
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str) -> object:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+np = _LazyModule('numpy')
+pd = _LazyModule('pandas')
+
+_CHUNK_ROWS = 65536
+
+# read_csv options that pandas doesn't support with the pyarrow engine, reading falls back to the default engine when any of them are passed.
+# dtype is supported but the pyarrow engine infers the column types first and casts afterwards (e.g. '001' is read as 1.0 and cast to '1.0').
+_PYARROW_UNSUPPORTED_CSV_OPTIONS = frozenset([
+    'chunksize', 'comment', 'converters', 'dayfirst', 'delim_whitespace', 'dialect', 'dtype', 'float_precision', 'iterator', 'lineterminator',
+    'low_memory', 'memory_map', 'nrows', 'quoting', 'skipfooter', 'skipinitialspace', 'thousands', 'verbose',
+])
+
+@functools.cache
+def _pyarrow_installed() -> bool:
+    """
+    Returns True if pyarrow can be imported.  pyarrow is optional, it is only used to speed up reading CSV files.
+    """
+    return importlib.util.find_spec('pyarrow') is not None
+
+def _csv_engine(engine: str | None, sep: str | None, kwargs: dict) -> str | None:
+    """
+    Returns the engine to pass to `pd.read_csv()`.  The pyarrow engine is replaced with the default engine (None) when pyarrow isn't installed,
+    the separator isn't a single character, an option the pyarrow engine doesn't support is passed, `skiprows` isn't a number of rows or
+    `usecols` is a callable.  A None separator is sniffed from the file, which only the python engine can do.
+    """
+    if engine == 'pyarrow' and (not _pyarrow_installed() or not isinstance(sep, str) or len(sep) != 1
+                                or not _PYARROW_UNSUPPORTED_CSV_OPTIONS.isdisjoint(kwargs)
+                                or not isinstance(kwargs.get('skiprows', 0), int) or callable(kwargs.get('usecols'))):
+        return 'python' if sep is None else None
+    return engine
+
+def _isin(values: np.ndarray | pd.Series, check_value: list) -> np.ndarray | pd.Series:
+    """
+    Returns a boolean mask of the values that are in check_value for either a raw ndarray or a Series.  NaN never equals itself, so a NaN
+    check value is matched with `np.isnan` on a float ndarray the same as `Series.isin` matches it.
+    """
+    if isinstance(values, np.ndarray):
+        mask = np.isin(values, check_value)
+        if values.dtype.kind == 'f' and any(isinstance(value, float) and value != value for value in check_value):
+            mask |= np.isnan(values)
+        return mask
+    return values.isin(check_value)
+
+def _isin_values(check_value: list) -> np.ndarray | list:
+    """
+    Returns the values of an IN check prepared once before the column is scanned.  Other iterables (e.g. a set, which `np.isin` would treat as
+    a single value) are converted to a list first.  A list of numbers becomes a sorted ndarray of the unique values, so `np.isin` doesn't convert
+    the list again for every block of rows and can use its integer lookup table.  Other lists are returned as is since converting them to an
+    ndarray could change the types being compared (e.g. [1, 'a'] becomes ['1', 'a']).
+    """
+    if (isinstance(check_value, collections.abc.Iterable) and not isinstance(check_value, (list, tuple, str, bytes))
+            and not hasattr(check_value, 'dtype')):
+        check_value = list(check_value)
+    if isinstance(check_value, (list, tuple)) and check_value and all(_is_machine_number(value) for value in check_value):
+        return np.unique(np.asarray(check_value))
+    return check_value
+
+# the operator and error message template of each check condition, looked up once when a check constraint is created.  The operator module
+# functions are used rather than numpy ufuncs so numpy isn't imported with the module, on an ndarray they call the same ufuncs.
+_CHECK_CONDITIONS = types.MappingProxyType({
+    '=': (operator.eq, "Error:  CHECK Constraint:  All values in {column_name} must be equal to {check_value}."),
+    '>': (operator.gt, "Error:  CHECK Constraint:  All values in {column_name} must be greater than {check_value}."),
+    '<': (operator.lt, "Error:  CHECK Constraint:  All values in {column_name} must be less than {check_value}."),
+    '>=': (operator.ge, "Error:  CHECK Constraint:  All values in {column_name} must be greater than or equal to {check_value}."),
+    '<=': (operator.le, "Error:  CHECK Constraint:  All values in {column_name} must be less than or equal to {check_value}."),
+    '!=': (operator.ne, "Error:  CHECK Constraint:  All values in {column_name} must not equal {check_value}."),
+    'IN': (_isin, "Error:  CHECK Constraint:  All values in {column_name} must be in {check_value}."),
+})
+
+# relative cost of validating each constraint type, cheaper constraints are validated first so invalid data fails as early as possible
+_CONSTRAINT_COST = types.MappingProxyType({
+    'not_null_constraint': 0,
+    'default_value_constraint': 1,
+    'check_constraint': 2,
+    'unique_constraint': 3,
+    'primary_key_constraint': 4,
+})
+
+def _column_values(series: pd.Series) -> np.ndarray | pd.Series:
+    """
+    Returns the raw ndarray of a numpy backed bool/int/float column so comparisons skip the Series wrapper.  Object, datetime/timedelta and
+    extension columns are returned as the Series so pandas keeps handling their null, mixed type and string (e.g. '2024-01-01') comparisons.
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+        return series.to_numpy()
+    return series
+
+def _as_mask(result: np.ndarray | pd.Series) -> np.ndarray:
+    """
+    Converts a comparison result into a boolean ndarray.  Missing results (pd.NA) count as passing, the same as `Series.all()` skips them.
+    """
+    if isinstance(result, pd.Series):
+        return result.to_numpy(dtype=bool, na_value=True)
+    return np.asarray(result, dtype=bool)
+
+@functools.cache
+def _check_kernels() -> types.ModuleType | None:
+    """
+    Returns the `_check_kernels` module of numba kernels for CHECK constraints, or None if numba isn't installed.  The module (and numba) is
+    only imported the first time a column large enough for the kernels is validated.
+    """
+    try:
+        from etl_file_tools import _check_kernels
+    except ImportError:  # numba is optional, CHECK constraints are validated with NumPy without it
+        return None
+    return _check_kernels
+
+def _is_machine_number(value: object) -> bool:
+    """
+    Returns True if the value is an int that fits in an int64 or a float (bools are excluded).
+    """
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return -2 ** 63 <= value < 2 ** 63
+    return isinstance(value, float)
+
+def _numba_first_violation(values: np.ndarray | pd.Series, checks: list) -> int | None:
+    """
+    Returns the position of the first value that fails any of the checks using the compiled numba kernels, or None if the checks can't be run
+    by them.  The kernels are only used for int64 and float64 ndarrays of at least `_CHUNK_ROWS` values (smaller columns aren't worth importing
+    numba for) compared against int/float check values.
+    """
+    if (not isinstance(values, np.ndarray) or values.dtype.kind not in 'if' or len(values) < _CHUNK_ROWS
+            or not all(_is_machine_number(check_value) for _, check_value in checks)):
+        return None
+
+    check_kernels = _check_kernels()
+    if check_kernels is None:
+        return None
+    return check_kernels.first_violation(values, checks)
+
+def _first_violation(values: np.ndarray | pd.Series, checks: list) -> int:
+    """
+    Returns the position of the first value that fails any of the (operator, check_value) checks, or -1 if every value passes.  Large numeric
+    columns are scanned by compiled numba kernels when numba is installed.  Otherwise the values are compared in blocks of `_CHUNK_ROWS` rows so
+    a violation stops the scan at the block it is found in.
+    """
+    position = _numba_first_violation(values, checks)
+    if position is not None:
+        return position
+
+    for start in range(0, len(values), _CHUNK_ROWS):
+        chunk = values[start:start + _CHUNK_ROWS] if isinstance(values, np.ndarray) else values.iloc[start:start + _CHUNK_ROWS]
+        mask = np.ones(len(chunk), dtype=bool)
+        for check_operator, check_value in checks:
+            mask &= _as_mask(check_operator(chunk, check_value))
+        if not mask.all():
+            return start + int(np.argmax(~mask))
+    return -1
+
+def _key_values(dataframe: pd.DataFrame, column_names: list | tuple) -> np.ndarray | pd.Series | pd.DataFrame:
+    """
+    Returns the values of the key columns: the `_column_values` of a single column (so a numpy backed column is a raw ndarray), or the
+    DataFrame of the columns.
+    """
+    if len(column_names) == 1:
+        return _column_values(dataframe[column_names[0]])
+    return dataframe[list(column_names)]
+
+def _keys_have_duplicates(keys: np.ndarray | pd.Series | pd.DataFrame) -> bool:
+    """
+    Returns True if any of the `_key_values` are duplicates.  A raw ndarray of ints/bools (or floats without NaN, which never equals itself) is
+    sorted and the neighbouring values compared, which is several times faster than hashing them.  Other raw ndarrays are counted with
+    `pd.unique` which skips building a Series (unless they hold unhashable values, e.g. lists, which only `duplicated()` can compare), a single
+    column Series is checked with `Series.duplicated()` which skips the row tuple handling of `DataFrame.duplicated()`.
+    """
+    if isinstance(keys, np.ndarray):
+        if keys.dtype.kind in 'biu' or (keys.dtype.kind == 'f' and not np.isnan(keys).any()):
+            sorted_keys = np.sort(keys)
+            return bool((sorted_keys[1:] == sorted_keys[:-1]).any())
+        try:
+            return len(pd.unique(keys)) != len(keys)
+        except TypeError:
+            keys = pd.Series(keys, copy=False)
+    return bool(keys.duplicated().to_numpy().any())
+
+def _sweep_column(values: np.ndarray | pd.Series, compiled: dict) -> tuple:
+    """
+    Sweeps the `_column_values` of a column for its compiled NOT NULL/PRIMARY KEY null checks and CHECK conditions (see `_compile_constraints`).
+
+    Returns:
+        tuple: (has_null_violation, has_check_violation) - True if the column has a null value that isn't allowed / a value failing a check.
+    """
+    has_null_violation = compiled['nulls_needed'] and bool(pd.isna(values).any())
+    has_check_violation = bool(compiled['checks']) and _first_violation(values, compiled['checks']) >= 0
+    return has_null_violation, has_check_violation
+
+def _has_duplicates(dataframe: pd.DataFrame, column_names: list | tuple) -> bool:
+    """
+    Returns True if any rows have duplicate values in the columns.
+    """
+    return _keys_have_duplicates(_key_values(dataframe=dataframe, column_names=column_names))
+
+def _run_constraints(constraints: list, dataframe: pd.DataFrame, errors: dict | None) -> None:
+    """
+    Runs the constraint functions on the dataframe.  The message of each ValueError raised is added to `errors` as a key (a dict keeps the
+    order the errors were found in and drops repeated messages), or the error is raised as is if `errors` is None.
+    """
+    for constraint in constraints:
+        try:
+            constraint(dataframe)
+        except ValueError as error:
+            if errors is None:
+                raise
+            errors.setdefault(str(error))
+
+def _keys_equal(keys: np.ndarray | pd.Series | pd.DataFrame, other_keys: np.ndarray | pd.Series | pd.DataFrame) -> bool:
+    """
+    Returns True if the `_key_values` are exactly the same as the other key values: the same type, datatype, index and values in the same order.
+    """
+    if isinstance(keys, np.ndarray):
+        if not isinstance(other_keys, np.ndarray) or keys.shape != other_keys.shape:
+            return False
+        keys, other_keys = pd.Series(keys, copy=False), pd.Series(other_keys, copy=False)
+    return type(keys) is type(other_keys) and keys.equals(other_keys)
+
+def _key_hashes(dataframe: pd.DataFrame, column_names: list | tuple) -> np.ndarray:
+    """
+    Returns the hash of each row of the columns.  Float columns have 0.0 added first so -0.0 hashes the same as 0.0, which it equals.
+    """
+    key_dataframe = dataframe[list(column_names)]
+    float_columns = [column_name for column_name, dtype in key_dataframe.dtypes.items() if dtype.kind == 'f']
+    if float_columns:
+        key_dataframe = key_dataframe.copy(deep=False)
+        for column_name in float_columns:
+            key_dataframe[column_name] = key_dataframe[column_name] + 0.0
+    return pd.util.hash_pandas_object(key_dataframe, index=False).to_numpy()
+
+def _duplicate_suspects(dataframe: pd.DataFrame, column_names: list | tuple) -> np.ndarray:
+    """
+    Returns the positions of the rows whose hash of the columns is shared with another row.  Each row of the columns is hashed once and np.unique
+    counts the hashes, every duplicate row is one of these rows but a hash collision can add rows that aren't duplicates.
+    """
+    _, inverse, counts = np.unique(_key_hashes(dataframe=dataframe, column_names=column_names), return_inverse=True, return_counts=True)
+    return np.flatnonzero(counts[inverse] > 1)
+
+def _fast_duplicated(dataframe: pd.DataFrame, column_names: list | tuple, keep: Literal['first', 'last', False] = 'first') -> np.ndarray:
+    """
+    Returns a boolean ndarray marking the duplicate rows of the columns, the same as `DataFrame.duplicated(subset=column_names, keep=keep)`.  Only
+    the rows from `_duplicate_suspects` are passed to pandas to confirm which of them are duplicates so a hash collision is never reported.
+    Columns with values pandas can't hash (e.g. lists) are passed to pandas as a whole.
+    """
+    try:
+        suspects = _duplicate_suspects(dataframe=dataframe, column_names=column_names)
+    except TypeError:
+        return dataframe.duplicated(subset=list(column_names), keep=keep).to_numpy()
+    duplicate_mask = np.zeros(len(dataframe), dtype=bool)
+    if len(suspects):
+        duplicate_mask[suspects] = dataframe.iloc[suspects].duplicated(subset=list(column_names), keep=keep).to_numpy()
+    return duplicate_mask
+
+def _hashable_value(value: object) -> object:
+    """
+    Returns a hashable stand-in for a check or default value of a constraint key.  Lists, tuples and arrays become tuples and sets become
+    frozensets, so equal values give equal keys.  Any other unhashable value is replaced by its repr.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if hasattr(value, 'tolist'):
+        # an ndarray (or Series), checked without importing numpy
+        return _hashable_value(value.tolist())
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
 class FileFrame:
     """
     A class to load and manipulate DataFrames from a file.  The main purpose is to validate the data being loaded into the dataframe using
@@ -13,20 +306,71 @@ class FileFrame:
 
     Attributes:
         _dataframe (pd.DataFrame): The internal DataFrame object that holds the data.
+        _owns_data (bool): True if the DataFrame's column data was read from a file or copied, so default values can be filled in place without
+            changing data the caller also holds.
+        _pending_read (tuple | None): The file path and `read_csv` options of a `read_csv_lazy` call whose file hasn't been read yet.
+        _validation_cache (dict | None): A copy of the `_key_values` of each tuple of PRIMARY KEY/UNIQUE columns the last time they were
+            validated to have no duplicates, or None unless the FileFrame was created with `cache_validated_keys=True`.  It is kept across reads so
+            reading exactly the same key values again skips the duplicate search.
         _constraints (list): A list of constraint functions to validate the DataFrame data.
         _constraint_details (list): A list of constraint objects to validate the DataFrame data.
+        _constraint_index (dict): The added constraint functions by their key (see `_constraint_key`), used to find duplicate constraints and the
+            constraint to remove in O(1).
+        _has_pk (bool): True if a primary key constraint has been added.
+        _pk_columns (frozenset): The columns of the primary key constraint, empty if there isn't one.
+        _compiled_checks (dict | None): The NOT NULL and CHECK constraints grouped by column name so each column is swept once during validation.
+            Built lazily from the constraints and reset to None whenever a constraint is added or removed.
+        _compiled_duplicates (dict): The PRIMARY KEY and UNIQUE constraints grouped by their tuple of column names.
+        _compiled_defaults (list): The default value constraint functions, applied before any of the validations.
+        _uncompiled_constraints (list): Constraint functions that can't be grouped (e.g. unsupported check conditions) and are run as is.
+        _batched_constraints (list | None): The constraint functions added inside a `batch_constraints` block, None outside of one.
     """
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, cache_validated_keys: bool = False, **kwargs) -> None:
         """
         Initializes the FileFrame instance with an empty DataFrame or data passed through *args and **kwargs.
 
         Args:
             *args: Positional arguments to be passed to pandas DataFrame constructor.
+            cache_validated_keys (bool, optional): If True, a copy of the PRIMARY KEY/UNIQUE key values is kept after they are validated, so
+                validating exactly the same key values again (e.g. re-reading the same file) skips the duplicate search.  The copy costs the
+                memory of the key columns and each validation compares the keys with it, so it only pays off when the same data is read again.
+                Defaults to False.
             **kwargs: Keyword arguments to be passed to pandas DataFrame constructor.
         """
         self._dataframe = pd.DataFrame(*args, **kwargs)
+        self._owns_data = False
+        self._pending_read = None
+        self._validation_cache = {} if cache_validated_keys else None
         self._constraints = []
         self._constraint_details = []
+        self._constraint_index = {}
+        self._has_pk = False
+        self._pk_columns = frozenset()
+        self._compiled_checks = None
+        self._compiled_duplicates = {}
+        self._compiled_defaults = []
+        self._uncompiled_constraints = []
+        self._batched_constraints = None
+
+    @classmethod
+    def from_dataframe(cls, dataframe: pd.DataFrame, copy: bool = True, cache_validated_keys: bool = False) -> FileFrame:
+        """
+        Creates a FileFrame from an existing DataFrame without rebuilding it, so the column datatypes that pandas already inferred are reused.
+        The constraints are not validated since none have been added yet, add the constraints and then call `validate_constraints`.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to load into the FileFrame.
+            copy (bool): If True (default) the data is copied.  If False only a shallow copy is made, so the FileFrame shares the column data with
+                the DataFrame and default values are filled into new columns instead of in place.
+            cache_validated_keys (bool): Keep a copy of the validated key values (see `__init__`).  Defaults to False.
+
+        Returns:
+            FileFrame: A FileFrame holding a copy of the DataFrame.
+        """
+        file_frame = cls(cache_validated_keys=cache_validated_keys)
+        file_frame._dataframe = dataframe.copy(deep=copy)
+        file_frame._owns_data = copy
+        return file_frame
 
     @property
     def dataframe(self) -> pd.DataFrame:
@@ -34,8 +378,11 @@ class FileFrame:
         This property allows access to the DataFrame that in the `FileFrame`.
 
         Returns:
-            pd.DataFrame: The loaded DataFrame.
+            pd.DataFrame: The loaded DataFrame.  A file passed to `read_csv_lazy` is read and validated the first time the DataFrame is used.
         """
+        if self._pending_read is not None:
+            file_path, kwargs = self._pending_read
+            self.read_csv(file_path=file_path, **kwargs)
         return self._dataframe
 
     @property
@@ -75,8 +422,9 @@ class FileFrame:
             ValueError: If the values in the specified column are null/missing.
         """
         def not_null_constraint(dataframe: pd.DataFrame) -> None:
-            if dataframe[column_name].isnull().any():
+            if dataframe[column_name].isna().to_numpy().any():
                 raise ValueError(f"Error:  NOT NULL Constraint:  {column_name} cannot have null values.")
+        not_null_constraint._constraint = _Constraint(constraint_name='not_null_constraint', column_name=column_name)
         return not_null_constraint
 
     @classmethod
@@ -93,12 +441,16 @@ class FileFrame:
         Raises:
             ValueError: If the values in the specified columns are null/missing or if they contain duplicate values.
         """
+        column_names = list(column_names)
+
         def primary_key_constraint(dataframe: pd.DataFrame) -> None:
-            if dataframe[column_names].isnull().any(axis=1).any():
+            key_dataframe = dataframe[column_names]
+            if key_dataframe.isna().to_numpy().any():
                 raise ValueError(f"Error:  PRIMARY KEY Constraint:  {column_names} cannot have null values.")
 
-            if any(dataframe.duplicated(subset=column_names)):
+            if _fast_duplicated(dataframe=key_dataframe, column_names=column_names).any():
                 raise ValueError(f"Error:  PRIMARY KEY Constraint:  {column_names} cannot have duplicate values.")
+        primary_key_constraint._constraint = _Constraint(constraint_name='primary_key_constraint', column_names=tuple(column_names))
         return primary_key_constraint
 
     @classmethod
@@ -115,9 +467,12 @@ class FileFrame:
         Raises:
             ValueError: If the values in the specified columns contain duplicate values.
         """
+        column_names = list(column_names)
+
         def unique_constraint(dataframe: pd.DataFrame) -> None:
-            if any(dataframe.duplicated(subset=column_names)):
+            if _has_duplicates(dataframe=dataframe, column_names=column_names):
                 raise ValueError(f"Error:  UNIQUE Constraint:  {column_names} cannot have duplicate values.")
+        unique_constraint._constraint = _Constraint(constraint_name='unique_constraint', column_names=tuple(column_names))
         return unique_constraint
 
     @classmethod
@@ -136,36 +491,27 @@ class FileFrame:
         Raises:
             ValueError: If the condition is not recognized or if the values in the column don't meet the condition.
         """
+        check_operator, check_error = _CHECK_CONDITIONS.get(check_condition.upper().strip(), (None, None))
+        if check_error is not None:
+            check_error = check_error.format(column_name=column_name, check_value=check_value)
+
         def check_constraint(dataframe: pd.DataFrame) -> None:
-            if check_condition.upper().strip() == '=':
-                if not (dataframe[column_name] == check_value).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must be equal to {check_value}.")
-            elif check_condition.upper().strip() == '>':
-                if not (dataframe[column_name] > check_value).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must be greater than {check_value}.")
-            elif check_condition.upper().strip() == '<':
-                if not (dataframe[column_name] < check_value).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must be less than {check_value}.")
-            elif check_condition.upper().strip() == '>=':
-                if not (dataframe[column_name] >= check_value).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must be greater than or equal to {check_value}.")
-            elif check_condition.upper().strip() == '<=':
-                if not (dataframe[column_name] <= check_value).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must be less than or equal to {check_value}.")
-            elif check_condition.upper().strip() == '!=':
-                if not (dataframe[column_name] != check_value).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must not equal {check_value}.")
-            elif check_condition.upper().strip() == 'IN':
-                if not (dataframe[column_name].isin(check_value)).all():
-                    raise ValueError(f"Error:  CHECK Constraint:  All values in {column_name} must be in {check_value}.")
-            else:
+            if check_operator is None:
                 raise ValueError(f"Error:  Unsupported check condition: {check_condition}")
+            checks = [(check_operator, _isin_values(check_value) if check_operator is _isin else check_value)]
+            if _first_violation(_column_values(dataframe[column_name]), checks) >= 0:
+                raise ValueError(check_error)
+        check_constraint._constraint = _Constraint(constraint_name='check_constraint', column_name=column_name, check_condition=check_condition,
+                                                   check_value=check_value)
         return check_constraint
 
     @classmethod
     def constraint_default_value(cls, column_name: str, default_value: int | str | float, **kwargs) -> callable:
         """
-        Creates a constraint function to default null/missing values in a column to a value.
+        Creates a constraint function to default null/missing values in a column to a value.  The function fills a new column unless it is
+        called with `fill_in_place=True` (which `validate_constraints` does when the FileFrame's data isn't shared with the caller) and no kwargs
+        were passed, in which case float columns filled with a number and object columns are filled in place with the value converted to the
+        column's datatype, instead of allocating a new column.
 
         Args:
             column_name (str): The name of the column to default null/missing values.
@@ -175,13 +521,27 @@ class FileFrame:
         Returns:
             callable: A function that defaults null/missing values to a value.
         """
-        def default_value_constraint(dataframe: pd.DataFrame) -> None:
-            dataframe[column_name] = dataframe[column_name].fillna(value=default_value, **kwargs)
+        is_number = isinstance(default_value, (int, float)) and not isinstance(default_value, bool)
+
+        def default_value_constraint(dataframe: pd.DataFrame, fill_in_place: bool = False) -> None:
+            column = dataframe[column_name]
+            fill_in_place = fill_in_place and not kwargs and (
+                column.dtype == object or (is_number and column.dtype.kind == 'f' and isinstance(column.dtype, np.dtype)))
+            values = column.to_numpy() if fill_in_place else None
+            if values is not None and values.flags.writeable:
+                # the ndarray is a view of the column, so the missing values are filled without allocating a new column
+                missing = pd.isna(values)
+                if missing.any():
+                    values[missing] = values.dtype.type(default_value) if values.dtype.kind == 'f' else default_value
+            else:
+                dataframe[column_name] = column.fillna(value=default_value, **kwargs)
+        default_value_constraint._constraint = _Constraint(constraint_name='default_value_constraint', column_name=column_name,
+                                                           default_value=default_value)
         return default_value_constraint
 
     def add_constraint(self, constraint_func: callable) -> None:
         """
-        Adds a constraint function to the list of constraints.
+        Adds a constraint function to the list of constraints.  Inside a `batch_constraints` block the constraint is added when the block exits.
 
         Args:
             constraint_func (callable): The constraint function to be added.
@@ -189,22 +549,29 @@ class FileFrame:
         Raises:
             ValueError: If the same constraint is applied to the same columns or if more than one primary key constraint exists.
         """
+        if self._batched_constraints is not None:
+            self._batched_constraints.append(constraint_func)
+            return
+
         input_constraint = FileFrame._get_constraint_closure_function_details(func=constraint_func)
-        for constraint in self.constraint_details:
-            if (input_constraint.constraint_name == 'primary_key_constraint'
-                    and input_constraint.constraint_name == constraint.constraint_name):
-                raise ValueError(f"Error:  There can only be one primary key constraint on a dataframe.")
+        input_key = FileFrame._constraint_key(constraint=input_constraint)
+        if input_constraint.constraint_name == 'primary_key_constraint' and self._has_pk:
+            raise ValueError(f"Error:  There can only be one primary key constraint on a dataframe.")
 
-            if (input_constraint.constraint_name == 'not_null_constraint' and constraint.constraint_name == 'primary_key_constraint'
-                    and input_constraint.column_name in constraint.column_names):
-                raise ValueError(f"Error:  There is already a primary key not null constraint on the column {input_constraint.column_name}.")
+        if input_constraint.constraint_name == 'not_null_constraint' and input_constraint.column_name in self._pk_columns:
+            raise ValueError(f"Error:  There is already a primary key not null constraint on the column {input_constraint.column_name}.")
 
-            if input_constraint == constraint:
-                column_variable = input_constraint.column_names if input_constraint.column_name is None else input_constraint.column_name
-                raise ValueError(f"Error:  The {constraint.constraint_name} already exists on column(s) - {column_variable}.")
+        if input_key in self._constraint_index:
+            column_variable = list(input_constraint.column_names) if input_constraint.column_name is None else input_constraint.column_name
+            raise ValueError(f"Error:  The {input_constraint.constraint_name} already exists on column(s) - {column_variable}.")
 
         self._constraints.append(constraint_func)
         self._constraint_details.append(input_constraint)
+        self._constraint_index[input_key] = constraint_func
+        if input_constraint.constraint_name == 'primary_key_constraint':
+            self._has_pk = True
+            self._pk_columns = frozenset(input_constraint.column_names)
+        self._compiled_checks = None
 
     def remove_constraint(self, constraint_func: callable) -> None:
         """
@@ -215,25 +582,78 @@ class FileFrame:
             constraint_func (callable): The constraint function to be removed.
         """
         input_constraint = FileFrame._get_constraint_closure_function_details(func=constraint_func)
-        self._constraints = [func for func in self.constraints if func != constraint_func]
-        self._constraint_details = [details for details in self.constraint_details if details != input_constraint]
+        removed_func = self._constraint_index.pop(FileFrame._constraint_key(constraint=input_constraint), None)
+        if removed_func is None:
+            return
+
+        # the functions and their details are appended together so they are at the same position in both lists
+        position = self._constraints.index(removed_func)
+        del self._constraints[position]
+        del self._constraint_details[position]
+        if input_constraint.constraint_name == 'primary_key_constraint':
+            self._has_pk = False
+            self._pk_columns = frozenset()
+        self._compiled_checks = None
+
+    @contextlib.contextmanager
+    def batch_constraints(self):
+        """
+        Context manager that adds all the constraints passed to `add_constraint` inside the block at once when the block exits.  The constraints
+        are checked in the order they were added, the same as adding them one at a time, but every invalid constraint is reported in one error
+        and none of the batch is added if any of them is invalid.  A batch inside another batch is part of the outer batch.
 
-    def find_duplicate_records(self, column_names: list, **kwargs) -> pd.DataFrame:
+        Yields:
+            FileFrame: This FileFrame.
 
+        Raises:
+            ValueError: If any of the batched constraints can't be added, with the error of each of them on its own line.
         """
-        Finds and returns rows in the DataFrame that have duplicate values based on the specified columns.  Additional options for the
-        `duplicated()` function can be provided through `kwargs`.
+        if self._batched_constraints is not None:
+            yield self
+            return
+
+        self._batched_constraints = []
+        try:
+            yield self
+            batched_constraints = self._batched_constraints
+        finally:
+            self._batched_constraints = None
+
+        saved_state = (list(self._constraints), list(self._constraint_details), dict(self._constraint_index), self._has_pk, self._pk_columns)
+        errors = {}
+        for constraint_func in batched_constraints:
+            try:
+                self.add_constraint(constraint_func=constraint_func)
+            except ValueError as error:
+                errors.setdefault(str(error))
+        if errors:
+            self._constraints, self._constraint_details, self._constraint_index, self._has_pk, self._pk_columns = saved_state
+            self._compiled_checks = None
+            raise ValueError('\n'.join(errors))
+
+    def find_duplicate_records(self, column_names: list, return_index: bool = False,
+                               keep: Literal['first', 'last', False] = 'first') -> pd.DataFrame | np.ndarray:
+
+        """
+        Finds and returns rows in the DataFrame that have duplicate values based on the specified columns.  The rows of the columns are hashed
+        first so only the rows that share a hash are compared.
 
         Args:
             column_names (list): A list of column names to check for duplicates.
-            **kwargs: Additional keyword arguments to pass to the `duplicated()` method. These may include: - `keep`: Determines which duplicates to
-                      mark as `True`. Options are 'first', 'last', or `False` (all duplicates).
+            return_index (bool, optional): If True, only the positions of the duplicate rows are returned so the rows aren't copied into a new
+                DataFrame (e.g. to log the bad rows or select them later with `iloc`).  Defaults to False.
+            keep (Literal['first', 'last', False], optional): Determines which duplicates to mark as `True`, the same as the `keep` option of
+                `duplicated()`.  Options are 'first' (default), 'last', or `False` (all duplicates).
 
         Returns:
-            pd.DataFrame: A DataFrame containing only the rows that are duplicates based on the specified columns.
+            pd.DataFrame | np.ndarray: A DataFrame containing only the rows that are duplicates based on the specified columns, or an ndarray of
+            the positions of those rows if `return_index` is True.
         """
-        duplicate_dataframe = self.dataframe[column_names].duplicated(**kwargs)
-        return self.dataframe[duplicate_dataframe]
+        dataframe = self.dataframe
+        duplicate_mask = _fast_duplicated(dataframe=dataframe, column_names=column_names, keep=keep)
+        if return_index:
+            return np.flatnonzero(duplicate_mask)
+        return dataframe[duplicate_mask]
 
     def read_excel(self, file_path: str, sheet_name: int=0, **kwargs) -> None:
         """
@@ -248,10 +668,13 @@ class FileFrame:
         Raises:
             ValueError: If any of the constraints are violated after reading the data.
         """
+        self._pending_read = None
         self._dataframe = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
-        self._validate_constraints()
+        self._owns_data = True
+        self.validate_constraints()
 
-    def read_csv(self, file_path: str, sep: str = ',', **kwargs) -> None:
+    def read_csv(self, file_path: str, sep: str = ',', engine: str | None = None, dtype_backend: str | None = None, chunksize: int | None = None,
+                 schema: dict | None = None, schema_from_constraints: bool = False, **kwargs) -> None:
         """
         Reads data from a CSV file and loads it into the DataFrame after validating constraints.  Additional options for the `read_csv()` function
         can be provided through `kwargs`.
@@ -259,13 +682,79 @@ class FileFrame:
         Args:
             file_path (str): The path to the CSV file.
             sep (str, optional): The delimiter for separating values in the CSV file. Defaults to ','.
+            engine (str | None, optional): The parser engine to use.  Defaults to None which uses the default pandas engine.  'pyarrow' parses the
+                file using multiple threads, but infers some types differently (e.g. ISO dates are read as dates rather than strings).  The
+                default pandas engine is used instead if pyarrow isn't installed or the options passed aren't supported by the pyarrow engine.
+            dtype_backend (str | None, optional): The backend of the column data types, 'numpy_nullable' or 'pyarrow'.  Defaults to None which
+                uses numpy backed columns.
+            chunksize (int | None, optional): If set, the file is read and validated `chunksize` rows at a time and the chunks are concatenated
+                once at the end, so the parser never holds more than one chunk.  The PRIMARY KEY/UNIQUE keys are searched for duplicates as the
+                chunks are read, unless pandas infers different datatypes for the key columns of a chunk: those key columns are then read again
+                as a whole after the last chunk so they have the same datatypes (and duplicates) as a read of the whole file.  If a constraint is
+                violated the DataFrame holds the chunk that failed, or the concatenated chunks if the duplicates are found after the last chunk.
+                Defaults to None which reads the whole file at once.
+            schema (dict | None, optional): The data type of each column (column name: data type).  The columns are parsed straight into these types
+                instead of pandas inferring the types, using the default pandas engine.  Defaults to None.
+            schema_from_constraints (bool, optional): If True, the data types of the columns with CHECK constraints are derived from the check
+                values (int: 'Int64', int/float: 'Float64', str: 'string', bool: 'boolean').  Columns in `schema` keep the type given there.
+                Defaults to False.
             **kwargs: Additional keyword arguments to pass to `pd.read_csv()`.
 
         Raises:
-            ValueError: If any of the constraints are violated after reading the data.
+            ValueError: If any of the constraints are violated after reading the data, or if `schema` or `schema_from_constraints` is passed with
+                a `dtype` that isn't a dict.
+        """
+        # a pending `read_csv_lazy` read is only done once the file has been read, so a read that fails (e.g. the file is missing) stays pending
+        if chunksize is None:
+            dataframe = self._read_csv_dataframe(file_path=file_path, sep=sep, engine=engine, dtype_backend=dtype_backend, schema=schema,
+                                                 schema_from_constraints=schema_from_constraints, **kwargs)
+            self._dataframe, self._owns_data, self._pending_read = dataframe, True, None
+            self.validate_constraints()
+            return
+
+        kwargs = self._csv_options(dtype_backend=dtype_backend, schema=schema, schema_from_constraints=schema_from_constraints, kwargs=kwargs)
+        chunks = []
+        seen_keys = {}
+        chunk_engine = _csv_engine(engine=engine, sep=sep, kwargs={**kwargs, 'chunksize': chunksize})
+        with pd.read_csv(file_path, sep=sep, engine=chunk_engine, chunksize=chunksize, **kwargs) as reader:
+            self._owns_data, self._pending_read = True, None
+            for chunk in reader:
+                self._dataframe = chunk
+                self._validate_constraints_streaming(chunk=chunk, previous_chunks=chunks, seen_keys=seen_keys)
+                chunks.append(chunk)
+        if not chunks:
+            return
+
+        self._dataframe = pd.concat(chunks, ignore_index=True)
+        unsearched_keys = [column_names for column_names, (_, seen_hashes) in seen_keys.items() if seen_hashes is None]
+        if not unsearched_keys:
+            return
+
+        # pandas inferred different datatypes for the key columns of some of the chunks (e.g. 1 is an int in one chunk and a string in a chunk
+        # with 'a'), so the key columns are read again as a whole to get the datatypes (and duplicates) a read of the whole file would give
+        key_columns = list(dict.fromkeys(column_name for column_names in unsearched_keys for column_name in column_names))
+        key_kwargs = {**kwargs, 'usecols': key_columns}
+        key_dataframe = pd.read_csv(file_path, sep=sep, engine=_csv_engine(engine=engine, sep=sep, kwargs=key_kwargs), **key_kwargs)
+        self._dataframe[key_columns] = key_dataframe[key_columns]
+        errors = {}
+        for column_names in unsearched_keys:
+            if _has_duplicates(dataframe=self._dataframe, column_names=column_names):
+                _run_constraints(constraints=self._compiled_duplicates[column_names], dataframe=self._dataframe, errors=errors)
+        if errors:
+            raise ValueError('\n'.join(errors))
+
+    def read_csv_lazy(self, file_path: str, **kwargs) -> None:
+        """
+        Defers reading a CSV file until the DataFrame is used.  The file is read and validated with `read_csv` the first time the `dataframe`
+        property (or a method that needs the data) is used, while `validate_constraints` only parses the columns the constraints are on, so a
+        file can be validated without loading all of its columns.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            **kwargs: Additional keyword arguments to pass to `read_csv()`.
         """
-        self._dataframe = pd.read_csv(file_path, sep=sep, **kwargs)
-        self._validate_constraints()
+        self._owns_data = True
+        self._pending_read = (file_path, kwargs)
 
     def read_fwf(self, file_path: str, colspecs: list) -> None:
         """
@@ -279,8 +768,10 @@ class FileFrame:
         Raises:
             ValueError: If any of the constraints are violated after reading the data.
         """
+        self._pending_read = None
         self._dataframe = pd.read_fwf(file_path, colspecs=colspecs)
-        self._validate_constraints()
+        self._owns_data = True
+        self.validate_constraints()
 
     def read_dict(self, data_dict: dict, **kwargs) -> None:
         """
@@ -294,8 +785,11 @@ class FileFrame:
         Raises:
             ValueError: If any of the constraints are violated after reading the data.
         """
+        self._pending_read = None
         self._dataframe = pd.DataFrame(data_dict, **kwargs)
-        self._validate_constraints()
+        # pandas copies the columns of a dict unless told not to, but not the columns of a DataFrame
+        self._owns_data = isinstance(data_dict, dict) and kwargs.get('copy') is not False
+        self.validate_constraints()
 
     def column_names(self) -> list:
         """
@@ -314,44 +808,326 @@ class FileFrame:
             dict: A dict of the column datatypes of the DataFrame where the key is the column name and value is the
             column datatype.
         """
-        datatypes =  self.dataframe.dtypes
-        return datatypes.to_dict()
+        return self.dataframe.dtypes.to_dict()
+
+    def has_nulls(self, column_name: str) -> bool:
+        """
+        Returns True if the column has any null/missing values.  The null mask is reduced on the underlying ndarray.
 
-    def _validate_constraints(self) -> None:
+        Args:
+            column_name (str): The name of the column to check for null values.
+
+        Returns:
+            bool: True if the column has at least one null/missing value, False otherwise.
+        """
+        return bool(self.dataframe[column_name].isna().to_numpy().any())
+
+    def validate_constraints(self, fail_fast: bool = False) -> None:
         """
-        Validates the DataFrame against all added constraints.
+        Validates the DataFrame against all added constraints.  This is called by each of the read methods and can be called directly to
+        validate a DataFrame loaded with `from_dataframe`.  Default values are applied first, then each constrained column is swept once:
+        a single null mask is shared by the NOT NULL and PRIMARY KEY constraints and the CHECK conditions on the column are combined into one
+        mask per block of rows, stopping at the first block with a violation.  Duplicates are searched once per set of PRIMARY KEY/UNIQUE
+        columns, unless `cache_validated_keys` is set and the key values are exactly the same as the last time they were found to have no
+        duplicates.  When a sweep finds a
+        violation the constraint functions for it are run so the error raised is the constraint's own.  Every violated constraint is reported
+        in one error so fixing the data doesn't take a validation per violation.
+
+        Args:
+            fail_fast (bool, optional): If True, the error of the first violated constraint is raised without validating the rest of the
+                constraints.  Defaults to False.
 
         Raises:
-            ValueError: If any constraint is violated.
+            ValueError: If any constraint is violated, with the error of each violated constraint on its own line.
         """
-        for constraint in self._constraints:
-            constraint(self.dataframe)
+        if self._compiled_checks is None:
+            self._compile_constraints()
+
+        errors = None if fail_fast else {}
+        dataframe = self._dataframe if self._pending_read is None else self._read_pending_columns()
+        column_values = self._validate_columns(dataframe=dataframe, errors=errors)
+        for column_names, constraints in self._compiled_duplicates.items():
+            # the values of a single key column were already taken from the dataframe by the column sweep
+            keys = column_values.get(column_names[0]) if len(column_names) == 1 else None
+            if keys is None:
+                keys = _key_values(dataframe=dataframe, column_names=column_names)
+            validated_keys = None if self._validation_cache is None else self._validation_cache.get(column_names)
+            if validated_keys is not None and _keys_equal(keys, validated_keys):
+                # the same key values were already found to have no duplicates
+                continue
+            if _keys_have_duplicates(keys):
+                _run_constraints(constraints=constraints, dataframe=dataframe, errors=errors)
+            elif self._validation_cache is not None:
+                # a copy, since the key values may be a view of the columns which can be changed in place
+                self._validation_cache[column_names] = keys.copy()
+        if errors:
+            raise ValueError('\n'.join(errors))
+
+    def _csv_options(self, dtype_backend: str | None, schema: dict | None, schema_from_constraints: bool, kwargs: dict) -> dict:
+        """
+        Returns the `pd.read_csv()` options for the `read_csv` arguments that aren't passed to pandas as is (see `read_csv`).
+
+        Raises:
+            ValueError: If `schema` or `schema_from_constraints` is passed with a `dtype` that isn't a dict (e.g. `dtype=str`).
+        """
+        kwargs = dict(kwargs)
+        if dtype_backend is not None:
+            kwargs['dtype_backend'] = dtype_backend
+        if schema is not None or schema_from_constraints:
+            if not isinstance(kwargs.get('dtype', {}), dict):
+                raise ValueError(f"Error:  A schema can't be combined with dtype={kwargs['dtype']!r}, pass the column data types in a dict instead.")
+            kwargs['dtype'] = {**(self._constraint_schema() if schema_from_constraints else {}), **(schema or {}), **kwargs.get('dtype', {})}
+        return kwargs
+
+    def _read_csv_dataframe(self, file_path: str, sep: str = ',', engine: str | None = None, dtype_backend: str | None = None,
+                            schema: dict | None = None, schema_from_constraints: bool = False, **kwargs) -> pd.DataFrame:
+        """
+        Reads a whole CSV file with the `read_csv` arguments (except `chunksize`) without validating it.
+
+        Returns:
+            pd.DataFrame: The DataFrame read from the file.
+        """
+        kwargs = self._csv_options(dtype_backend=dtype_backend, schema=schema, schema_from_constraints=schema_from_constraints, kwargs=kwargs)
+        return pd.read_csv(file_path, sep=sep, engine=_csv_engine(engine=engine, sep=sep, kwargs=kwargs), **kwargs)
+
+    def _read_pending_columns(self) -> pd.DataFrame:
+        """
+        Reads the columns of the `read_csv_lazy` file that the constraints are on (all the `usecols` columns if they were passed), so the file can
+        be validated without loading the other columns.  The read stays pending and the whole file is read the first time the DataFrame is used.
+
+        Returns:
+            pd.DataFrame: The constrained columns of the file.
+        """
+        column_names = set()
+        for constraint in self._constraint_details:
+            column_names.update(constraint.column_names or (constraint.column_name,))
+        # constraint functions that aren't on a column (e.g. custom functions) have no column name
+        column_names.discard(None)
+        if not column_names:
+            return pd.DataFrame()
+
+        file_path, kwargs = self._pending_read
+        kwargs = {'usecols': sorted(column_names), **kwargs}
+        kwargs.pop('chunksize', None)
+        return self._read_csv_dataframe(file_path=file_path, **kwargs)
+
+    def _validate_constraints_streaming(self, chunk: pd.DataFrame, previous_chunks: list, seen_keys: dict) -> None:
+        """
+        Validates one chunk of a file read in chunks.  The column constraints only need the chunk itself, while the PRIMARY KEY/UNIQUE
+        constraints look up the hashes of the chunk's key columns in the sorted uint64 ndarray of the key hashes from the previous chunks (8
+        bytes per unique key).  A hash match is confirmed by running the constraint functions on the key columns of all the chunks read so far,
+        so a hash collision isn't reported.  The hashes depend on the datatypes pandas inferred for the chunk, so once a chunk's key datatypes
+        differ from the first chunk's the keys are no longer searched here and are left to `read_csv` to validate.
+
+        Args:
+            chunk (pd.DataFrame): The chunk to validate.
+            previous_chunks (list): The chunks that have already been validated.
+            seen_keys (dict): The (key datatypes of the first chunk, sorted key hashes seen so far) of each tuple of PRIMARY KEY/UNIQUE columns,
+                updated with the chunk's keys.  The key hashes are None once a chunk's key datatypes differ from the first chunk's.
+
+        Raises:
+            ValueError: If any constraint is violated, with the error of each constraint violated by the chunk on its own line.
+        """
+        if self._compiled_checks is None:
+            self._compile_constraints()
+
+        errors = {}
+        self._validate_columns(dataframe=chunk, errors=errors)
+        for column_names, constraints in self._compiled_duplicates.items():
+            key_datatypes = tuple(chunk[list(column_names)].dtypes)
+            first_key_datatypes, seen_hashes = seen_keys.setdefault(column_names, (key_datatypes, np.empty(0, dtype=np.uint64)))
+            if seen_hashes is None:
+                continue
+            if key_datatypes != first_key_datatypes:
+                seen_keys[column_names] = (first_key_datatypes, None)
+                continue
+
+            key_hashes = _key_hashes(dataframe=chunk, column_names=column_names)
+            chunk_hashes = np.unique(key_hashes)
+            if len(chunk_hashes) != len(key_hashes) or np.isin(chunk_hashes, seen_hashes, assume_unique=True).any():
+                key_dataframe = pd.concat([frame[list(column_names)] for frame in [*previous_chunks, chunk]], ignore_index=True)
+                _run_constraints(constraints=constraints, dataframe=key_dataframe, errors=errors)
+            seen_keys[column_names] = (first_key_datatypes, np.union1d(seen_hashes, chunk_hashes))
+        if errors:
+            raise ValueError('\n'.join(errors))
+
+    def _validate_columns(self, dataframe: pd.DataFrame, errors: dict | None = None) -> dict:
+        """
+        Applies the default value constraints to the dataframe (in place if `_owns_data`) and then validates the NOT NULL, CHECK and PRIMARY KEY
+        null constraints with one sweep per column.  Each swept column's values are taken from the dataframe once and returned so the duplicate
+        search can reuse them.  The columns of dataframes with at least `_CHUNK_ROWS` rows and more than two constrained columns are swept by a
+        thread pool.
+
+        Args:
+            dataframe (pd.DataFrame): The dataframe to validate.
+            errors (dict | None, optional): The error messages of the violated constraints are added to this dict as keys.  If None, the error
+                of the first violated constraint is raised.  Defaults to None.
+
+        Returns:
+            dict: The `_column_values` of each swept column by column name.
+
+        Raises:
+            ValueError: If any constraint is violated and `errors` is None.
+        """
+        _run_constraints(constraints=self._uncompiled_constraints, dataframe=dataframe, errors=errors)
+
+        for constraint in self._compiled_defaults:
+            # only the default value functions created by `constraint_default_value` can fill in place, and only data the caller doesn't share
+            if self._owns_data and hasattr(constraint, '_constraint'):
+                constraint(dataframe, fill_in_place=True)
+            else:
+                constraint(dataframe)
+
+        column_values = {column_name: _column_values(dataframe[column_name]) for column_name in self._compiled_checks}
+        compiled_checks = list(self._compiled_checks.items())
+        if len(compiled_checks) > 2 and len(dataframe) >= _CHUNK_ROWS:
+            # NumPy releases the GIL while it scans a numeric column, so the columns of a large dataframe are swept in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                sweeps = list(executor.map(lambda item: _sweep_column(values=column_values[item[0]], compiled=item[1]), compiled_checks))
+        else:
+            sweeps = (_sweep_column(values=column_values[column_name], compiled=compiled) for column_name, compiled in compiled_checks)
+
+        # the constraint functions of the violations are run in column order so the errors are in the same order however the columns were swept
+        for (column_name, compiled), (has_null_violation, has_check_violation) in zip(compiled_checks, sweeps):
+            if has_null_violation:
+                _run_constraints(constraints=compiled['null_constraints'], dataframe=dataframe, errors=errors)
+
+            if has_check_violation:
+                _run_constraints(constraints=compiled['check_constraints'], dataframe=dataframe, errors=errors)
+
+        return column_values
+
+    def _constraint_schema(self) -> dict:
+        """
+        Returns the data types of the columns with CHECK constraints derived from the type of their check values.  Nullable data types are used
+        so columns with missing values can still be parsed.  Columns with check values of mixed types are left out.
+
+        Returns:
+            dict: A dict where the key is the column name and the value is the column data type.
+        """
+        value_types = {}
+        for constraint in self._constraint_details:
+            if constraint.constraint_name == 'check_constraint':
+                check_value = constraint.check_value
+                check_values = check_value if isinstance(check_value, (list, tuple, set, frozenset)) else [check_value]
+                value_types.setdefault(constraint.column_name, set()).update(type(check_value) for check_value in check_values)
+
+        schema = {}
+        for column_name, value_type_set in value_types.items():
+            if value_type_set == {bool}:
+                schema[column_name] = 'boolean'
+            elif value_type_set == {int}:
+                schema[column_name] = 'Int64'
+            elif value_type_set in ({float}, {int, float}):
+                schema[column_name] = 'Float64'
+            elif value_type_set == {str}:
+                schema[column_name] = 'string'
+        return schema
+
+    def _compile_constraints(self) -> None:
+        """
+        Groups the added constraints by the columns they validate so `validate_constraints` can fuse them into one pass per column.  The
+        constraints are grouped in order of their `_CONSTRAINT_COST` (NOT NULL, CHECK, UNIQUE, PRIMARY KEY) so the cheapest checks run first.  The
+        order constraints are validated in is an implementation detail and not the order they were added in.
+        """
+        compiled_checks = {}
+        compiled_duplicates = {}
+        compiled_defaults = []
+        uncompiled_constraints = []
+
+        def column_entry(column_name: str) -> dict:
+            return compiled_checks.setdefault(column_name, {'nulls_needed': False, 'checks': [], 'null_constraints': [], 'check_constraints': []})
+
+        constraints = sorted(zip(self._constraints, self._constraint_details), key=lambda pair: _CONSTRAINT_COST.get(pair[1].constraint_name, 0))
+        for constraint_func, constraint in constraints:
+            if constraint.constraint_name == 'not_null_constraint':
+                entry = column_entry(constraint.column_name)
+                entry['nulls_needed'] = True
+                entry['null_constraints'].append(constraint_func)
+            elif constraint.constraint_name == 'primary_key_constraint':
+                for column_name in constraint.column_names:
+                    entry = column_entry(column_name)
+                    entry['nulls_needed'] = True
+                    entry['null_constraints'].append(constraint_func)
+                compiled_duplicates.setdefault(constraint.column_names, []).append(constraint_func)
+            elif constraint.constraint_name == 'unique_constraint':
+                compiled_duplicates.setdefault(constraint.column_names, []).append(constraint_func)
+            elif constraint.constraint_name == 'check_constraint' and constraint.check_condition.upper().strip() in _CHECK_CONDITIONS:
+                entry = column_entry(constraint.column_name)
+                check_operator = _CHECK_CONDITIONS[constraint.check_condition.upper().strip()][0]
+                check_value = _isin_values(constraint.check_value) if check_operator is _isin else constraint.check_value
+                entry['checks'].append((check_operator, check_value))
+                entry['check_constraints'].append(constraint_func)
+            elif constraint.constraint_name == 'default_value_constraint':
+                compiled_defaults.append(constraint_func)
+            else:
+                uncompiled_constraints.append(constraint_func)
+
+        self._compiled_checks = compiled_checks
+        self._compiled_duplicates = compiled_duplicates
+        self._compiled_defaults = compiled_defaults
+        self._uncompiled_constraints = uncompiled_constraints
 
     @staticmethod
     def _get_constraint_closure_function_details(func: callable) -> _Constraint:
         """
-        Returns a _Constraint object that consists of the closure function parameters and values in a dict, name , value.
+        Returns the _Constraint object that describes a constraint closure function.  Every constraint factory method attaches this object to the
+        function it returns as `_constraint`, so looking up the details is a single attribute access.  Functions built without the attribute are
+        handled by `_introspect_constraint_closure`.
+
+        Args:
+            func (callable): A constraint closure function returned by one of the constraint factory methods.
 
         Returns:
             _Constraint: A constraint object that contains all the details for each constraint inputted.
         """
-        func_details = {}
-        for i, cell in enumerate(func.__closure__):
-            param_name = func.__code__.co_freevars[i]
-            param_value = cell.cell_contents
-            if param_name != 'kwargs':
-                func_details['constraint_name'] = func.__name__
-                func_details[param_name] = param_value
+        constraint = getattr(func, '_constraint', None)
+        return constraint if constraint is not None else FileFrame._introspect_constraint_closure(func)
+
+    @staticmethod
+    def _introspect_constraint_closure(func: callable) -> _Constraint:
+        """
+        Returns a _Constraint object built from the closure function parameters and values.  This is the fallback for closure functions that were
+        not created by the constraint factory methods and so don't carry a `_constraint` attribute.
+
+        Args:
+            func (callable): A constraint closure function without a `_constraint` attribute.
+
+        Returns:
+            _Constraint: A constraint object that contains all the details for each constraint inputted.
+        """
+        func_details = {'constraint_name': func.__name__}
+        for param_name, cell in zip(func.__code__.co_freevars, func.__closure__ or ()):
+            if param_name in _Constraint.__dataclass_fields__:
+                param_value = cell.cell_contents
+                func_details[param_name] = tuple(param_value) if param_name == 'column_names' else param_value
         return _Constraint(**func_details)
 
+    @staticmethod
+    def _constraint_key(constraint: _Constraint) -> tuple:
+        """
+        Returns a hashable key that identifies a constraint.  The columns are a frozenset so the order the columns were listed in doesn't matter
+        and the check and default values are made hashable (see `_hashable_value`).  Column names are interned so the keys of constraints on the
+        same columns share the column name strings.
+
+        Returns:
+            tuple: The constraint name, columns, check condition, check value and default value of the constraint.
+        """
+        column_names = constraint.column_names if constraint.column_name is None else (constraint.column_name,)
+        columns = frozenset(sys.intern(column_name) if isinstance(column_name, str) else column_name for column_name in column_names)
+        return (constraint.constraint_name, columns, constraint.check_condition, _hashable_value(constraint.check_value),
+                _hashable_value(constraint.default_value))
+
     def __repr__(self) -> repr:
         """
-        Returns a string representation of the FileFrame object.
+        Returns a string representation of the FileFrame object.  A pending `read_csv_lazy` file isn't read (or validated) to build it.
 
         Returns:
-            str: A string representation of the internal DataFrame.
+            str: A string representation of the internal DataFrame, or of the file path of a pending `read_csv_lazy` read.
         """
-        return repr(self.dataframe)
+        if self._pending_read is not None:
+            return f"{self.__class__.__name__}(pending read of {self._pending_read[0]!r})"
+        return repr(self._dataframe)
 
     def __str__(self) -> str:
         """
@@ -362,15 +1138,15 @@ class FileFrame:
         """
         return f"{self.__class__.__name__}"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Constraint:
     """Represents a database constraint with various attributes.  This class is an internal class used only for maintaining data for each constraint.
     Think of it only as a container that allows for easy access of the constraint parameters.
 
     Attributes:
         constraint_name (str): The name of the constraint.
-        column_names (list): A list of column names affected by the constraint.
-            Defaults to an empty list.
+        column_names (tuple): A tuple of column names affected by the constraint.
+            Defaults to an empty tuple.
         column_name (str, optional): A single column name affected by the constraint.
             Defaults to None.
         check_condition (str, optional): The condition for a check constraint.
@@ -381,7 +1157,7 @@ class _Constraint:
             Defaults to None.
     """
     constraint_name: str
-    column_names: list = field(default_factory=list)
+    column_names: tuple = field(default_factory=tuple)
     column_name: str = None
     check_condition: str = None
     check_value: int | str | float | list = None
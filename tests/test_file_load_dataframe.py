@@ -1,8 +1,12 @@
+import contextlib
+import operator
 import pytest
-from unittest.mock import patch
+import subprocess
+import sys
+from unittest.mock import Mock
 from etl_file_tools.file_load_dataframe import FileFrame
+import numpy as np
 import pandas as pd
-import re
 
 data = {
     'Id': ['001', '001', '003', None, ],
@@ -15,94 +19,224 @@ data = {
     'Test3': [1, 1, 3, 4, ],
 }
 
+@pytest.fixture(scope='session', params=['numpy', 'nullable'])
+def base_dataframe(request):
+    # the test data is built into a DataFrame once per set of datatypes and shared by the tests.  'numpy' has the numpy/object columns that
+    # read_dict and read_csv give, 'nullable' has the strings and ints with missing values in pandas' nullable 'string' and 'Int64' columns
+    if request.param == 'numpy':
+        return pd.DataFrame(data)
+    return pd.DataFrame({
+        column_name: pd.array(values, dtype='string' if isinstance(values[0], str) else 'Int64') for column_name, values in data.items()
+    })
+
+@pytest.fixture()
+def custom_dataframe(base_dataframe):
+    # shallow copy of the shared DataFrame, for tests that don't change the data
+    dataframe = FileFrame.from_dataframe(dataframe=base_dataframe, copy=False)
+    return dataframe
+
 @pytest.fixture()
-def custom_dataframe():
-    dataframe = FileFrame()
+def copied_dataframe(base_dataframe):
+    # deep copy of the shared DataFrame, for tests that change the data (e.g. default values)
+    dataframe = FileFrame.from_dataframe(dataframe=base_dataframe)
     return dataframe
 
+@pytest.fixture()
+def file_frame():
+    # empty FileFrame, for tests that read their own data instead of using the shared DataFrame
+    return FileFrame()
+
+@pytest.fixture()
+def csv_path(tmp_path):
+    # the test data written to a csv file
+    file_path = tmp_path / 'data.csv'
+    pd.DataFrame(data).to_csv(file_path, index=False)
+    return file_path
+
+@contextlib.contextmanager
+def raises_containing(expected_exception: type, message: str):
+    """Context manager that checks the exception is raised and its message contains the message, without building a regex from it."""
+    with pytest.raises(expected_exception=expected_exception) as exc_info:
+        yield exc_info
+    assert message in str(exc_info.value)
+
+# the DataFrame returned by the mocked pandas readers, built once when the module is imported
+_CACHED_DF = pd.DataFrame({'A': [None, 2, 3], 'B': [4, 5, 6]})
+
 @pytest.fixture
-def mock_dataframe():
-    """Fixture to return a mock DataFrame."""
-    return pd.DataFrame({'A': [None, 2, 3], 'B': [4, 5, 6]})
+def patched_readers(monkeypatch):
+    """Fixture to mock the pandas file readers so they return the cached DataFrame."""
+    readers = {reader: Mock(return_value=_CACHED_DF) for reader in ('read_excel', 'read_csv', 'read_fwf')}
+    for reader, mock_reader in readers.items():
+        monkeypatch.setattr(pd, reader, mock_reader)
+    return readers
+
+def test_import_does_not_import_pandas():
+    # importing the module and creating constraints shouldn't import pandas or numpy
+    code = ("import sys; from etl_file_tools.file_load_dataframe import FileFrame; FileFrame.constraint_not_null(column_name='Id'); "
+            "print('pandas' in sys.modules, 'numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False False'
 
 def test_get_dataframe(custom_dataframe):
-    custom_dataframe.read_dict(data_dict=data)
     dataframe = custom_dataframe.dataframe
     assert isinstance(dataframe, pd.DataFrame)
 
-def test_get_constraints(custom_dataframe):
-    custom_dataframe.read_dict(data_dict=data)
-    constraints = custom_dataframe.constraints
+def test_from_dataframe(base_dataframe):
+    # the dataframe is copied so filling the default values doesn't change the shared dataframe
+    file_frame = FileFrame.from_dataframe(dataframe=base_dataframe)
+    file_frame.add_constraint(constraint_func=file_frame.constraint_default_value(column_name='Id', default_value='004'))
+    file_frame.validate_constraints()
+    assert file_frame.dataframe['Id'].tolist() == ['001', '001', '003', '004']
+    assert base_dataframe['Id'].isna().to_numpy().any()
+
+def test_get_constraints(file_frame):
+    constraints = file_frame.constraints
     assert isinstance(constraints, tuple)
 
-def test_get_constraint_details(custom_dataframe):
-    custom_dataframe.read_dict(data_dict=data)
-    constraint_details = custom_dataframe.constraint_details
+def test_get_constraint_details(file_frame):
+    constraint_details = file_frame.constraint_details
     assert isinstance(constraint_details, tuple)
 
+def test_constraint_details_column_names(file_frame):
+    # initialize the unique constraint on the city and code columns
+    column_names = ['City', 'Code']
+    unique_constraint = file_frame.constraint_unique(column_names=column_names)
+    file_frame.add_constraint(constraint_func=unique_constraint)
+    # changing the list after the constraint is created doesn't change the constraint
+    column_names.append('Test')
+    assert file_frame.constraint_details[0].column_names == ('City', 'Code')
+    # the constraint details can be used in sets
+    assert len(set(file_frame.constraint_details)) == 1
+
 def test_constraint_not_null(custom_dataframe):
     # initialize the not null constraint on the city column
     not_null_constraint_city = custom_dataframe.constraint_not_null(column_name='City')
     # add the not_null_constraint_city to the dataframe
     custom_dataframe.add_constraint(constraint_func=not_null_constraint_city)
-    # build the dataframe - since the City column has no nulls there should be exception raised
-    custom_dataframe.read_dict(data_dict=data)
+    # validate the dataframe - since the City column has no nulls there should be exception raised
+    custom_dataframe.validate_constraints()
 
 def test_constraint_not_null_error(custom_dataframe):
     # initialize the not null constraint on the id column
     not_null_constraint_id = custom_dataframe.constraint_not_null(column_name='Id')
     # add the not_null_constraint_id to the dataframe
     custom_dataframe.add_constraint(constraint_func=not_null_constraint_id)
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  NOT NULL Constraint:  Id cannot have null values.")):
-        custom_dataframe.read_dict(data_dict=data)
+    with raises_containing(expected_exception=ValueError, message="Error:  NOT NULL Constraint:  Id cannot have null values.") as error:
+        custom_dataframe.validate_constraints(fail_fast=True)
+    # only the first violated constraint is reported
+    assert 'PRIMARY KEY' not in str(error.value)
+
+def test_validate_constraints_all_errors(custom_dataframe):
+    # initialize a primary key constraint on the code column and a not null constraint on the id column - both are violated
+    custom_dataframe.add_constraint(constraint_func=custom_dataframe.constraint_primary_key(column_names=['Code']))
+    custom_dataframe.add_constraint(constraint_func=custom_dataframe.constraint_not_null(column_name='Id'))
+    # both violations are reported in one error, one per line
+    with pytest.raises(expected_exception=ValueError) as error:
+        custom_dataframe.validate_constraints()
+    assert str(error.value).split('\n') == [
+        "Error:  NOT NULL Constraint:  Id cannot have null values.",
+        "Error:  PRIMARY KEY Constraint:  ['Code'] cannot have duplicate values.",
+    ]
 
 def test_constraint_primary_key(custom_dataframe):
     # initialize the primary key constraint on the city column
     primary_key_constraint_city = custom_dataframe.constraint_primary_key(column_names=['City'])
     # add the primary_key_constraint_city to the dataframe
     custom_dataframe.add_constraint(constraint_func=primary_key_constraint_city)
-    # build the dataframe - since the City column has no nulls or no duplicates there should be exception raised
-    custom_dataframe.read_dict(data_dict=data)
+    # validate the dataframe - since the City column has no nulls or no duplicates there should be exception raised
+    custom_dataframe.validate_constraints()
 
 def test_constraint_primary_key_duplicate_error(custom_dataframe):
     # initialize the primary key constraint on the code column
     primary_key_constraint_code = custom_dataframe.constraint_primary_key(column_names=['Code'])
     # add the primary_key_constraint_code to the dataframe
     custom_dataframe.add_constraint(constraint_func=primary_key_constraint_code)
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  PRIMARY KEY Constraint:  ['Code'] cannot have duplicate values.")):
-        custom_dataframe.read_dict(data_dict=data)
+    with raises_containing(expected_exception=ValueError, message="Error:  PRIMARY KEY Constraint:  ['Code'] cannot have duplicate values."):
+        custom_dataframe.validate_constraints()
+
+def test_constraint_primary_key_signed_zero_error(file_frame):
+    # initialize the primary key constraint on a float column where -0.0 duplicates 0.0
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['A']))
+    with raises_containing(expected_exception=ValueError, message="Error:  PRIMARY KEY Constraint:  ['A'] cannot have duplicate values."):
+        file_frame.read_dict(data_dict={'A': [0.0, -0.0, 1.0]})
 
 def test_constraint_primary_key_null_error(custom_dataframe):
     # initialize the primary key constraint on the id column
     primary_key_constraint_id = custom_dataframe.constraint_primary_key(column_names=['Id'])
     # add the primary_key_constraint_id to the dataframe
     custom_dataframe.add_constraint(constraint_func=primary_key_constraint_id)
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  PRIMARY KEY Constraint:  ['Id'] cannot have null values.")):
-        custom_dataframe.read_dict(data_dict=data)
+    with raises_containing(expected_exception=ValueError, message="Error:  PRIMARY KEY Constraint:  ['Id'] cannot have null values."):
+        custom_dataframe.validate_constraints()
 
 def test_constraint_unique(custom_dataframe):
     # initialize the unique constraint on the age column
     unique_constraint_age = custom_dataframe.constraint_unique(column_names=['Age'])
     # add the unique_constraint_age to the dataframe
     custom_dataframe.add_constraint(constraint_func=unique_constraint_age)
-    # build the dataframe - since the age column no duplicates there should be exception raised
-    custom_dataframe.read_dict(data_dict=data)
+    # validate the dataframe - since the age column no duplicates there should be exception raised
+    custom_dataframe.validate_constraints()
 
 def test_constraint_unique_error(custom_dataframe):
     # initialize the unique constraint on the id column
     unique_constraint_id = custom_dataframe.constraint_unique(column_names=['Id'])
     # add the unique_constraint_id to the dataframe
     custom_dataframe.add_constraint(constraint_func=unique_constraint_id)
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  UNIQUE Constraint:  ['Id'] cannot have duplicate values.")):
-        custom_dataframe.read_dict(data_dict=data)
+    with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['Id'] cannot have duplicate values."):
+        custom_dataframe.validate_constraints()
+
+@pytest.mark.parametrize(
+    'values, has_duplicates', [
+        ([3, 1, 2], False),
+        ([3, 1, 3], True),
+        ([1.5, None, 2.5], False),
+        ([1.5, None, None], True),
+        ([0.0, -0.0, 1.0], True),
+    ],
+)
+def test_constraint_unique_numeric(file_frame, values, has_duplicates):
+    # initialize the unique constraint on a numeric column
+    file_frame.add_constraint(constraint_func=file_frame.constraint_unique(column_names=['Value']))
+    if not has_duplicates:
+        file_frame.read_dict(data_dict={'Value': values})
+        return
+    with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['Value'] cannot have duplicate values."):
+        file_frame.read_dict(data_dict={'Value': values})
+
+def test_constraint_unique_validated_after_new_read_error():
+    # initialize the unique constraint on the code column of a FileFrame that keeps the validated key values
+    file_frame = FileFrame(cache_validated_keys=True)
+    file_frame.add_constraint(constraint_func=file_frame.constraint_unique(column_names=['Code']))
+    # read the same unique values twice - the second validation reuses the first result
+    file_frame.read_dict(data_dict={'Code': ['1', '2', '3']})
+    file_frame.read_dict(data_dict={'Code': ['1', '2', '3']})
+    assert file_frame._validation_cache[('Code',)].tolist() == ['1', '2', '3']
+    # read duplicate values - the key values changed so they are searched for duplicates again
+    with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['Code'] cannot have duplicate values."):
+        file_frame.read_dict(data_dict={'Code': ['1', '2', '2']})
+
+def test_constraint_unique_validated_after_new_read_same_hashes_error():
+    # initialize the unique constraint on the code column of a FileFrame that keeps the validated key values
+    file_frame = FileFrame(cache_validated_keys=True)
+    file_frame.add_constraint(constraint_func=file_frame.constraint_unique(column_names=['Code']))
+    file_frame.read_dict(data_dict={'Code': [1, '1']})
+    # 1 and '1' hash the same, the new values still have to be searched for duplicates
+    with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['Code'] cannot have duplicate values."):
+        file_frame.read_dict(data_dict={'Code': ['1', '1']})
+
+def test_constraint_unique_validated_keys_not_kept_by_default(file_frame):
+    # the validated key values are only kept when the FileFrame is created with cache_validated_keys=True
+    file_frame.add_constraint(constraint_func=file_frame.constraint_unique(column_names=['Code']))
+    file_frame.read_dict(data_dict={'Code': ['1', '2', '3']})
+    assert file_frame._validation_cache is None
 
 def test_constraint_check(custom_dataframe):
     # initialize the unique constraint on the id column
     check_constraint_age = custom_dataframe.constraint_check(column_name='Age', check_condition='>', check_value=10)
     # add the check_constraint_age to the dataframe
     custom_dataframe.add_constraint(constraint_func=check_constraint_age)
-    # build the dataframe - since the age column values are all greater than 10 there should be no exception raised
-    custom_dataframe.read_dict(data_dict=data)
+    # validate the dataframe - since the age column values are all greater than 10 there should be no exception raised
+    custom_dataframe.validate_constraints()
 
 @pytest.mark.parametrize(
     'column_name, condition, value, expected_result', [
@@ -121,99 +255,289 @@ def test_constraint_check_error(custom_dataframe, column_name, condition, value,
     check_constraint_age = custom_dataframe.constraint_check(column_name=column_name, check_condition=condition, check_value=value)
     # add the check_constraint_age to the dataframe
     custom_dataframe.add_constraint(constraint_func=check_constraint_age)
-    with pytest.raises(expected_exception=ValueError, match=re.escape(expected_result)):
-        custom_dataframe.read_dict(data_dict=data)
+    with raises_containing(expected_exception=ValueError, message=expected_result):
+        custom_dataframe.validate_constraints()
+
+@pytest.mark.parametrize(
+    'condition, value, has_violation', [
+        ('>', '2024-01-01', False),
+        ('>', '2024-01-02', True),
+        ('=', '2024-01-02', False),
+    ],
+)
+def test_constraint_check_datetime(file_frame, condition, value, has_violation):
+    # initialize the check constraint on a datetime column, the check value is a date string the same as pandas compares them
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='Date', check_condition=condition,
+                                                                                      check_value=value))
+    data_dict = {'Date': pd.to_datetime(['2024-01-02', '2024-01-02'])}
+    if not has_violation:
+        file_frame.read_dict(data_dict=data_dict)
+        return
+    with raises_containing(expected_exception=ValueError, message="Error:  CHECK Constraint:  All values in Date must be greater than 2024-01-02."):
+        file_frame.read_dict(data_dict=data_dict)
+
+def test_constraint_check_in_set(file_frame):
+    # initialize the in check constraint with a set of values
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='A', check_condition='in',
+                                                                                      check_value=frozenset({1, 2, 3})))
+    # validate the data - every value is in the set so no exception should be raised
+    file_frame.read_dict(data_dict={'A': [1, 2]})
+
+@pytest.mark.parametrize('rows', [2, 70000])
+def test_constraint_check_in_nan(file_frame, rows):
+    # initialize the in check constraint with a NaN check value
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='A', check_condition='in',
+                                                                                      check_value=[1.0, float('nan')]))
+    # validate the data - the NaN values are in the check values so no exception should be raised
+    file_frame.read_dict(data_dict={'A': [1.0, float('nan')] * (rows // 2)})
+
+def test_constraint_check_error_past_first_block(file_frame):
+    # initialize the check constraint on the value column
+    check_constraint_value = file_frame.constraint_check(column_name='Value', check_condition='>=', check_value=0)
+    # add the check_constraint_value to the dataframe
+    file_frame.add_constraint(constraint_func=check_constraint_value)
+    # build a dataframe larger than one validation block where only the last value fails the check
+    values = list(range(70000))
+    values[-1] = -1
+    with raises_containing(expected_exception=ValueError, message="Error:  CHECK Constraint:  All values in Value must be greater than or equal to 0."):
+        file_frame.read_dict(data_dict={'Value': values})
+
+@pytest.mark.parametrize('dtype', ['int64', 'float64'])
+@pytest.mark.parametrize('writeable', [True, False])
+def test_check_kernels_first_violation(dtype, writeable):
+    # the numba kernels find the same first violation as NumPy, for read-only arrays (e.g. pandas columns under copy-on-write) too
+    pytest.importorskip('numba')
+    from etl_file_tools import _check_kernels
+    values = np.arange(10, dtype=dtype)
+    values.flags.writeable = writeable
+    assert _check_kernels.first_violation(values, [(operator.ge, 0), (operator.lt, 7)]) == 7
+    assert _check_kernels.first_violation(values, [(operator.gt, 2.5)]) == 0
+    assert _check_kernels.first_violation(values, [(operator.ne, 11)]) == -1
+    assert _check_kernels.first_violation(values[::2], [(operator.le, 5)]) == 3
+
+def test_validate_constraints_large_dataframe_error(file_frame):
+    # initialize constraints on three columns of a dataframe large enough for the columns to be swept in parallel
+    rows = 70000
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='A', check_condition='>=', check_value=0))
+    file_frame.add_constraint(constraint_func=file_frame.constraint_not_null(column_name='B'))
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='C', check_condition='<', check_value=rows - 1))
+    # the errors are reported in column order
+    with raises_containing(expected_exception=ValueError, message=(
+            "Error:  NOT NULL Constraint:  B cannot have null values.\n"
+            f"Error:  CHECK Constraint:  All values in C must be less than {rows - 1}.")):
+        file_frame.read_dict(data_dict={'A': range(rows), 'B': [1.0] * (rows - 1) + [None], 'C': range(rows)})
+
+def test_constraint_check_multiple_on_column_error(custom_dataframe):
+    # initialize two check constraints on the age column - the first passes and the second fails
+    check_constraint_age_1 = custom_dataframe.constraint_check(column_name='Age', check_condition='>', check_value=10)
+    check_constraint_age_2 = custom_dataframe.constraint_check(column_name='Age', check_condition='<', check_value=40)
+    # add both check constraints to the dataframe so they are validated in the same column pass
+    custom_dataframe.add_constraint(constraint_func=check_constraint_age_1)
+    custom_dataframe.add_constraint(constraint_func=check_constraint_age_2)
+    with raises_containing(expected_exception=ValueError, message="Error:  CHECK Constraint:  All values in Age must be less than 40."):
+        custom_dataframe.validate_constraints()
+
+def test_constraint_primary_key_and_unique_same_columns_error(custom_dataframe):
+    # initialize a unique and a primary key constraint on the same code column
+    unique_constraint_code = custom_dataframe.constraint_unique(column_names=['Code'])
+    primary_key_constraint_code = custom_dataframe.constraint_primary_key(column_names=['Code'])
+    # add the constraints to the dataframe - the unique constraint was added first so its error is raised
+    custom_dataframe.add_constraint(constraint_func=unique_constraint_code)
+    custom_dataframe.add_constraint(constraint_func=primary_key_constraint_code)
+    with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['Code'] cannot have duplicate values."):
+        custom_dataframe.validate_constraints()
 
-def test_constraint_default_value(custom_dataframe):
+def test_constraint_not_null_validated_before_primary_key_error(custom_dataframe):
+    # initialize a primary key constraint on the code column and a not null constraint on the id column - both are violated
+    primary_key_constraint_code = custom_dataframe.constraint_primary_key(column_names=['Code'])
+    not_null_constraint_id = custom_dataframe.constraint_not_null(column_name='Id')
+    # add the constraints to the dataframe - the cheaper not null constraint is validated first even though it was added last
+    custom_dataframe.add_constraint(constraint_func=primary_key_constraint_code)
+    custom_dataframe.add_constraint(constraint_func=not_null_constraint_id)
+    with raises_containing(expected_exception=ValueError, message="Error:  NOT NULL Constraint:  Id cannot have null values."):
+        custom_dataframe.validate_constraints()
+
+def test_constraint_default_value_before_not_null(copied_dataframe):
+    # initialize a not null constraint on the id column and a default value constraint to fill the id column
+    not_null_constraint_id = copied_dataframe.constraint_not_null(column_name='Id')
+    default_value_constraint_id = copied_dataframe.constraint_default_value(column_name='Id', default_value='004')
+    # add the constraints to the dataframe - default values are applied before the not null constraint is validated
+    copied_dataframe.add_constraint(constraint_func=not_null_constraint_id)
+    copied_dataframe.add_constraint(constraint_func=default_value_constraint_id)
+    copied_dataframe.validate_constraints()
+
+def test_constraint_default_value(copied_dataframe):
     # initialize the default value constraint on the id column
-    default_value_constraint_id = custom_dataframe.constraint_default_value(column_name='Id', default_value='004')
+    default_value_constraint_id = copied_dataframe.constraint_default_value(column_name='Id', default_value='004')
     # add the default_value_constraint_id to the dataframe
-    custom_dataframe.add_constraint(constraint_func=default_value_constraint_id)
+    copied_dataframe.add_constraint(constraint_func=default_value_constraint_id)
     # build the dataframe
-    custom_dataframe.read_dict(data_dict=data)
+    copied_dataframe.validate_constraints()
     # confirm no more null values exist in the id column
-    assert custom_dataframe.dataframe['Id'].isnull().sum() == 0
+    assert not copied_dataframe.has_nulls(column_name='Id')
 
-def test_add_constraint_duplicate_not_null_constraint_error(custom_dataframe):
+def test_constraint_default_value_object(file_frame):
+    # initialize the default value constraint on an object column
+    default_value_constraint_id = file_frame.constraint_default_value(column_name='Id', default_value='004')
+    file_frame.add_constraint(constraint_func=default_value_constraint_id)
+    # build the dataframe - the missing values of the object column are filled in place
+    file_frame.read_dict(data_dict=data)
+    assert file_frame.dataframe['Id'].dtype == object
+    assert file_frame.dataframe['Id'].tolist() == ['001', '001', '003', '004']
+
+def test_constraint_default_value_float(file_frame):
+    # initialize the default value constraint on a float column
+    default_value_constraint_score = file_frame.constraint_default_value(column_name='Score', default_value=0)
+    # add the default_value_constraint_score to the dataframe
+    file_frame.add_constraint(constraint_func=default_value_constraint_score)
+    # build the dataframe - the missing float values are filled in place
+    file_frame.read_dict(data_dict={'Score': [1.5, None, 3.5, None], 'Name': ['a', 'b', 'c', 'd']})
+    assert file_frame.dataframe['Score'].tolist() == [1.5, 0.0, 3.5, 0.0]
+
+def test_constraint_default_value_shared_data(file_frame):
+    # the default values are filled without changing the dataframes the data was loaded from
+    source_dataframe = pd.DataFrame({'Score': [1.5, None], 'Name': ['a', None]})
+    default_value_constraints = [FileFrame.constraint_default_value(column_name='Score', default_value=0),
+                                 FileFrame.constraint_default_value(column_name='Name', default_value='b')]
+    source_file_frame = FileFrame(source_dataframe)
+    for constraint in default_value_constraints:
+        file_frame.add_constraint(constraint_func=constraint)
+        source_file_frame.add_constraint(constraint_func=constraint)
+    file_frame.read_dict(data_dict=source_dataframe)
+    source_file_frame.validate_constraints()
+    assert file_frame.dataframe['Score'].tolist() == source_file_frame.dataframe['Score'].tolist() == [1.5, 0.0]
+    assert source_dataframe.isna().to_numpy().sum() == 2
+
+def test_add_constraint_duplicate_not_null_constraint_error(file_frame):
     # initialize the two not null constraint on same column id
-    not_null_constraint_id_1 = custom_dataframe.constraint_not_null(column_name='Id')
-    not_null_constraint_id_2 = custom_dataframe.constraint_not_null(column_name='Id')
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  The not_null_constraint already exists on column(s) - Id.")):
+    not_null_constraint_id_1 = file_frame.constraint_not_null(column_name='Id')
+    not_null_constraint_id_2 = file_frame.constraint_not_null(column_name='Id')
+    with raises_containing(expected_exception=ValueError, message="Error:  The not_null_constraint already exists on column(s) - Id."):
         #  add the not_null_constraint_id_1 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=not_null_constraint_id_1)
+        file_frame.add_constraint(constraint_func=not_null_constraint_id_1)
         #  add the not_null_constraint_id_2 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=not_null_constraint_id_2)
+        file_frame.add_constraint(constraint_func=not_null_constraint_id_2)
         # since a not null constraint already exists on the id column an exception should be raised
 
-def test_add_constraint_duplicate_primary_key_constraint_error(custom_dataframe):
+def test_add_constraint_duplicate_primary_key_constraint_error(file_frame):
     # initialize the primary key constraint on same columns city and test
-    primary_key_constraint_1 = custom_dataframe.constraint_primary_key(column_names=['City', 'Test'])
-    primary_key_constraint_2 = custom_dataframe.constraint_primary_key(column_names=['City', 'Test'])
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  There can only be one primary key constraint on a dataframe.")):
+    primary_key_constraint_1 = file_frame.constraint_primary_key(column_names=['City', 'Test'])
+    primary_key_constraint_2 = file_frame.constraint_primary_key(column_names=['City', 'Test'])
+    with raises_containing(expected_exception=ValueError, message="Error:  There can only be one primary key constraint on a dataframe."):
         #  add the primary_key_constraint_1 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=primary_key_constraint_1)
+        file_frame.add_constraint(constraint_func=primary_key_constraint_1)
         #  add the primary_key_constraint_2 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=primary_key_constraint_2)
+        file_frame.add_constraint(constraint_func=primary_key_constraint_2)
         # since a primary key constraint already exists on city and test column an exception should be raised
 
-def test_add_constraint_not_null_constraint_on_primary_key_constraint_error(custom_dataframe):
+def test_add_constraint_not_null_constraint_on_primary_key_constraint_error(file_frame):
     # initialize the primary key constraint on columns city and test and then a not null constraint on city
-    primary_key_constraint = custom_dataframe.constraint_primary_key(column_names=['City', 'Test'])
-    not_null_constraint = custom_dataframe.constraint_not_null(column_name='City')
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  There is already a primary key not null constraint on the column City.")):
+    primary_key_constraint = file_frame.constraint_primary_key(column_names=['City', 'Test'])
+    not_null_constraint = file_frame.constraint_not_null(column_name='City')
+    with raises_containing(expected_exception=ValueError, message="Error:  There is already a primary key not null constraint on the column City."):
         #  add the primary_key_constraint to the dataframe
-        custom_dataframe.add_constraint(constraint_func=primary_key_constraint)
+        file_frame.add_constraint(constraint_func=primary_key_constraint)
         #  add the not null to the dataframe
-        custom_dataframe.add_constraint(constraint_func=not_null_constraint)
+        file_frame.add_constraint(constraint_func=not_null_constraint)
         # since a primary key not null constraint already exists on city column an exception should be raised when trying to apply the not null constraint on column city
 
-def test_add_constraint_duplicate_unique_constraint_error(custom_dataframe):
+def test_add_constraint_duplicate_unique_constraint_error(file_frame):
     # initialize the unique constraint on same columns city and code
-    unique_constraint_1 = custom_dataframe.constraint_unique(column_names=['City', 'Code'])
-    unique_constraint_2 = custom_dataframe.constraint_unique(column_names=['City', 'Code'])
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  The unique_constraint already exists on column(s) - ['City', 'Code'].")):
+    unique_constraint_1 = file_frame.constraint_unique(column_names=['City', 'Code'])
+    unique_constraint_2 = file_frame.constraint_unique(column_names=['City', 'Code'])
+    with raises_containing(expected_exception=ValueError, message="Error:  The unique_constraint already exists on column(s) - ['City', 'Code']."):
         #  add the unique_constraint_1 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=unique_constraint_1)
+        file_frame.add_constraint(constraint_func=unique_constraint_1)
         #  add the unique_constraint_2 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=unique_constraint_2)
+        file_frame.add_constraint(constraint_func=unique_constraint_2)
         # since a unique constraint already exists on the city and code columns an exception should be raised
 
-def test_add_constraint_duplicate_check_constraint_error(custom_dataframe):
+def test_add_constraint_duplicate_unique_constraint_column_order_error(file_frame):
+    # initialize the unique constraint on the same columns city and code listed in a different order
+    unique_constraint_1 = file_frame.constraint_unique(column_names=['City', 'Code'])
+    unique_constraint_2 = file_frame.constraint_unique(column_names=['Code', 'City'])
+    with raises_containing(expected_exception=ValueError, message="Error:  The unique_constraint already exists on column(s) - ['Code', 'City']."):
+        #  add the unique_constraint_1 to the dataframe
+        file_frame.add_constraint(constraint_func=unique_constraint_1)
+        #  add the unique_constraint_2 to the dataframe
+        file_frame.add_constraint(constraint_func=unique_constraint_2)
+
+def test_add_constraint_primary_key_after_remove(file_frame):
+    # initialize two primary key constraints on different columns
+    primary_key_constraint_1 = file_frame.constraint_primary_key(column_names=['City'])
+    primary_key_constraint_2 = file_frame.constraint_primary_key(column_names=['Test'])
+    # add the first primary key, remove it and add the second one - no exception should be raised
+    file_frame.add_constraint(constraint_func=primary_key_constraint_1)
+    file_frame.remove_constraint(constraint_func=primary_key_constraint_1)
+    file_frame.add_constraint(constraint_func=primary_key_constraint_2)
+    # a not null constraint can be added on the column of the removed primary key
+    file_frame.add_constraint(constraint_func=file_frame.constraint_not_null(column_name='City'))
+    assert len(file_frame.constraint_details) == 2
+
+def test_add_constraint_duplicate_check_constraint_error(file_frame):
     # initialize the check constraint on same column age
-    check_constraint_1 = custom_dataframe.constraint_check(column_name='Age', check_condition='>', check_value=0)
-    check_constraint_2 = custom_dataframe.constraint_check(column_name='Age', check_condition='>', check_value=0)
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  The check_constraint already exists on column(s) - Age.")):
+    check_constraint_1 = file_frame.constraint_check(column_name='Age', check_condition='>', check_value=0)
+    check_constraint_2 = file_frame.constraint_check(column_name='Age', check_condition='>', check_value=0)
+    with raises_containing(expected_exception=ValueError, message="Error:  The check_constraint already exists on column(s) - Age."):
         #  add the check_constraint_1 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=check_constraint_1)
+        file_frame.add_constraint(constraint_func=check_constraint_1)
         #  add the check_constraint_2 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=check_constraint_2)
+        file_frame.add_constraint(constraint_func=check_constraint_2)
         # since a check constraint already exists on the age column an exception should be raised
 
-def test_add_constraint_duplicate_default_value_constraint_error(custom_dataframe):
+def test_add_constraint_unhashable_check_value(custom_dataframe):
+    # check values that can't be hashed as is can still be added
+    custom_dataframe.add_constraint(constraint_func=custom_dataframe.constraint_check(column_name='Age', check_condition='in',
+                                                                                      check_value={25, 30, 35, 40}))
+    custom_dataframe.add_constraint(constraint_func=custom_dataframe.constraint_check(column_name='Test', check_condition='in',
+                                                                                      check_value=np.array([1, 2, 3, 4])))
+    custom_dataframe.validate_constraints()
+    # the same array of values is a duplicate constraint
+    with raises_containing(expected_exception=ValueError, message="Error:  The check_constraint already exists on column(s) - Test."):
+        custom_dataframe.add_constraint(constraint_func=custom_dataframe.constraint_check(column_name='Test', check_condition='in',
+                                                                                          check_value=np.array([1, 2, 3, 4])))
+
+def test_add_constraint_duplicate_default_value_constraint_error(file_frame):
     # initialize the default value constraint on same column id
-    default_value_constraint_1 = custom_dataframe.constraint_default_value(column_name='Id', default_value='004')
-    default_value_constraint_2 = custom_dataframe.constraint_default_value(column_name='Id', default_value='004')
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  The default_value_constraint already exists on column(s) - Id.")):
+    default_value_constraint_1 = file_frame.constraint_default_value(column_name='Id', default_value='004')
+    default_value_constraint_2 = file_frame.constraint_default_value(column_name='Id', default_value='004')
+    with raises_containing(expected_exception=ValueError, message="Error:  The default_value_constraint already exists on column(s) - Id."):
         #  add the default_value_constraint_1 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=default_value_constraint_1)
+        file_frame.add_constraint(constraint_func=default_value_constraint_1)
         #  add the default_value_constraint_2 to the dataframe
-        custom_dataframe.add_constraint(constraint_func=default_value_constraint_2)
+        file_frame.add_constraint(constraint_func=default_value_constraint_2)
         # since a default value constraint already exists on the id column an exception should be raised
 
-def test_remove_constraint(custom_dataframe):
-    primary_key_constraint = custom_dataframe.constraint_primary_key(column_names=['City', 'Test'])
-    check_constraint_age = custom_dataframe.constraint_check(column_name='Age', check_condition='>', check_value=10)
-    unique_constraint_id = custom_dataframe.constraint_unique(column_names=['Id'])
-    not_null_constraint_id = custom_dataframe.constraint_not_null(column_name='Id')
-    custom_dataframe.add_constraint(constraint_func=primary_key_constraint)
-    custom_dataframe.add_constraint(constraint_func=check_constraint_age)
-    custom_dataframe.add_constraint(constraint_func=unique_constraint_id)
-    custom_dataframe.add_constraint(constraint_func=not_null_constraint_id)
-    custom_dataframe.remove_constraint(constraint_func=primary_key_constraint)
-    custom_dataframe.remove_constraint(constraint_func=check_constraint_age)
-    custom_dataframe.remove_constraint(constraint_func=unique_constraint_id)
-    custom_dataframe.remove_constraint(constraint_func=not_null_constraint_id)
-    assert len(custom_dataframe.constraints) == 0 and len(custom_dataframe.constraint_details) == 0
+def test_remove_constraint(file_frame):
+    primary_key_constraint = file_frame.constraint_primary_key(column_names=['City', 'Test'])
+    check_constraint_age = file_frame.constraint_check(column_name='Age', check_condition='>', check_value=10)
+    unique_constraint_id = file_frame.constraint_unique(column_names=['Id'])
+    not_null_constraint_id = file_frame.constraint_not_null(column_name='Id')
+    with file_frame.batch_constraints():
+        file_frame.add_constraint(constraint_func=primary_key_constraint)
+        file_frame.add_constraint(constraint_func=check_constraint_age)
+        file_frame.add_constraint(constraint_func=unique_constraint_id)
+        file_frame.add_constraint(constraint_func=not_null_constraint_id)
+    assert len(file_frame.constraints) == 4
+    file_frame.remove_constraint(constraint_func=primary_key_constraint)
+    file_frame.remove_constraint(constraint_func=check_constraint_age)
+    file_frame.remove_constraint(constraint_func=unique_constraint_id)
+    file_frame.remove_constraint(constraint_func=not_null_constraint_id)
+    assert len(file_frame.constraints) == 0 and len(file_frame.constraint_details) == 0
+
+def test_batch_constraints_error(file_frame):
+    # a primary key constraint already exists on the city column
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['City']))
+    # add a valid constraint and two invalid constraints in a batch - both errors are raised when the batch exits
+    with raises_containing(expected_exception=ValueError, message=(
+            "Error:  There is already a primary key not null constraint on the column City.\n"
+            "Error:  There can only be one primary key constraint on a dataframe.")):
+        with file_frame.batch_constraints():
+            file_frame.add_constraint(constraint_func=file_frame.constraint_not_null(column_name='Id'))
+            file_frame.add_constraint(constraint_func=file_frame.constraint_not_null(column_name='City'))
+            file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['Code']))
+    # none of the batch is added
+    assert len(file_frame.constraints) == 1 and len(file_frame.constraint_details) == 1
 
 @pytest.mark.parametrize(
     'keep, expected_result', [
@@ -223,14 +547,50 @@ def test_remove_constraint(custom_dataframe):
     ],
 )
 def test_find_duplicate_records(custom_dataframe, keep, expected_result):
-    # build the dataframe
-    custom_dataframe.read_dict(data_dict=data)
     # find the duplicate values in columns test2, test3
     duplicates = custom_dataframe.find_duplicate_records(column_names=['Test2', 'Test3'], keep=keep)
     # check records returned in dataframe
     assert duplicates.shape[0] == expected_result
 
-def test_read_excel(mock_dataframe):
+def test_find_duplicate_records_keep_modes(custom_dataframe):
+    # find the duplicate values in columns test2, test3 with each keep option on the same dataframe
+    duplicates_all = custom_dataframe.find_duplicate_records(column_names=['Test2', 'Test3'], return_index=True, keep=False)
+    duplicates_first = custom_dataframe.find_duplicate_records(column_names=['Test2', 'Test3'], return_index=True, keep='first')
+    duplicates_last = custom_dataframe.find_duplicate_records(column_names=['Test2', 'Test3'], return_index=True, keep='last')
+    assert (duplicates_all.tolist(), duplicates_first.tolist(), duplicates_last.tolist()) == ([0, 1], [1], [0])
+
+@pytest.mark.parametrize(
+    'keep, expected_result', [
+        (False, [0, 1]),
+        ('first', [1]),
+        ('last', [0]),
+    ],
+)
+def test_find_duplicate_records_return_index(custom_dataframe, keep, expected_result):
+    # find the positions of the duplicate values in columns test2, test3
+    duplicate_positions = custom_dataframe.find_duplicate_records(column_names=['Test2', 'Test3'], return_index=True, keep=keep)
+    # check the positions of the records returned
+    assert duplicate_positions.tolist() == expected_result
+
+def test_find_duplicate_records_signed_zero(file_frame):
+    # -0.0 equals 0.0 so the second row is a duplicate of the first
+    file_frame.read_dict(data_dict={'A': [0.0, -0.0, 1.0]})
+    duplicate_positions = file_frame.find_duplicate_records(column_names=['A'], return_index=True)
+    assert duplicate_positions.tolist() == [1]
+
+def test_find_duplicate_records_unhashable(file_frame):
+    # lists can't be hashed, the duplicate rows are still found
+    file_frame.read_dict(data_dict={'A': [[1], [1], [2]]})
+    duplicate_positions = file_frame.find_duplicate_records(column_names=['A'], return_index=True)
+    assert duplicate_positions.tolist() == [1]
+
+def test_constraint_primary_key_unhashable_error(file_frame):
+    # initialize the primary key constraint on a column of lists
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['A']))
+    with raises_containing(expected_exception=ValueError, message="Error:  PRIMARY KEY Constraint:  ['A'] cannot have duplicate values."):
+        file_frame.read_dict(data_dict={'A': [[1], [1], [2]]})
+
+def test_read_excel(patched_readers):
     # initialize the custom dataframe
     custom_dataframe = FileFrame()
     # initialize the constraint to test the validate constraints method call
@@ -238,16 +598,16 @@ def test_read_excel(mock_dataframe):
     # add the constraint to the dataframe
     custom_dataframe.add_constraint(constraint_func=constraint_1)
     # mock pandas.read_excel
-    with patch("pandas.read_excel", return_value=mock_dataframe) as mock_read_excel:
-        with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  NOT NULL Constraint:  A cannot have null values.")):
-            # test that a not null constraint is raised to test the validate constraint method call
-            custom_dataframe.read_excel(file_path="fake_path.xlsx")
-            # test pandas.read_excel is called
-            mock_read_excel.assert_called_once_with("fake_path.xlsx", sheet_name=0)
-            # test dataframe equality
-            pd.testing.assert_frame_equal(custom_dataframe.dataframe, mock_dataframe)
-
-def test_read_csv(mock_dataframe):
+    mock_read_excel = patched_readers['read_excel']
+    with raises_containing(expected_exception=ValueError, message="Error:  NOT NULL Constraint:  A cannot have null values."):
+        # test that a not null constraint is raised to test the validate constraint method call
+        custom_dataframe.read_excel(file_path="fake_path.xlsx")
+    # test pandas.read_excel is called
+    mock_read_excel.assert_called_once_with("fake_path.xlsx", sheet_name=0)
+    # test dataframe equality
+    pd.testing.assert_frame_equal(custom_dataframe.dataframe, _CACHED_DF)
+
+def test_read_csv(patched_readers):
     # initialize the custom dataframe
     custom_dataframe = FileFrame()
     # initialize the constraint to test the validate constraints method call
@@ -255,16 +615,138 @@ def test_read_csv(mock_dataframe):
     # add the constraint to the dataframe
     custom_dataframe.add_constraint(constraint_func=constraint_1)
     # mock pandas.read_csv
-    with patch("pandas.read_csv", return_value=mock_dataframe) as mock_read_csv:
-        with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  NOT NULL Constraint:  A cannot have null values.")):
-            # test that a not null constraint is raised to test the validate constraint method call
-            custom_dataframe.read_csv(file_path="fake_path.csv", sep=",")
-            # test pandas.read_csv is called
-            mock_read_csv.assert_called_once_with("fake_path.csv", sep=",")
-            # test dataframe equality
-            pd.testing.assert_frame_equal(custom_dataframe.dataframe, mock_dataframe)
-
-def test_read_fwf(mock_dataframe):
+    mock_read_csv = patched_readers['read_csv']
+    with raises_containing(expected_exception=ValueError, message="Error:  NOT NULL Constraint:  A cannot have null values."):
+        # test that a not null constraint is raised to test the validate constraint method call
+        custom_dataframe.read_csv(file_path="fake_path.csv", sep=",")
+    # test pandas.read_csv is called
+    mock_read_csv.assert_called_once_with("fake_path.csv", sep=",", engine=None)
+    # test dataframe equality
+    pd.testing.assert_frame_equal(custom_dataframe.dataframe, _CACHED_DF)
+
+@pytest.mark.parametrize(
+    'kwargs, expected_rows', [
+        ({}, 4),
+        ({'engine': 'pyarrow'}, 4),
+        ({'engine': 'pyarrow', 'nrows': 2}, 2),
+        ({'engine': 'pyarrow', 'sep': None}, 4),
+        ({'engine': 'pyarrow', 'skiprows': [1]}, 3),
+        ({'engine': 'pyarrow', 'usecols': lambda column_name: True}, 4),
+    ],
+)
+def test_read_csv_file(file_frame, csv_path, kwargs, expected_rows):
+    # initialize and add a primary key constraint on the city column
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['City']))
+    # read the csv file - options not supported by the pyarrow engine fall back to the default engine
+    file_frame.read_csv(file_path=csv_path, **kwargs)
+    assert file_frame.dataframe.shape[0] == expected_rows
+    assert file_frame.column_names() == list(data.keys())
+
+def test_read_csv_pyarrow_engine(file_frame, csv_path, monkeypatch):
+    # the pyarrow engine is used when pyarrow is installed instead of falling back to the default engine
+    pytest.importorskip('pyarrow')
+    mock_read_csv = Mock(wraps=pd.read_csv)
+    monkeypatch.setattr(pd, 'read_csv', mock_read_csv)
+    file_frame.read_csv(file_path=csv_path, engine='pyarrow')
+    assert mock_read_csv.call_args.kwargs['engine'] == 'pyarrow'
+    pd.testing.assert_frame_equal(file_frame.dataframe, pd.read_csv(csv_path, engine='pyarrow'))
+
+def test_read_csv_schema(file_frame, csv_path):
+    # initialize and add check constraints on the age and city columns
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='Age', check_condition='>', check_value=10))
+    file_frame.add_constraint(constraint_func=file_frame.constraint_check(column_name='City', check_condition='!=', check_value='Boston'))
+    # read the csv file with the schema derived from the check constraints - the id column type comes from the schema
+    file_frame.read_csv(file_path=csv_path, schema={'Id': 'string'}, schema_from_constraints=True)
+    column_datatypes = file_frame.column_datatypes()
+    assert column_datatypes['Age'] == 'Int64'
+    assert column_datatypes['City'] == 'string'
+    assert column_datatypes['Id'] == 'string'
+    assert file_frame.dataframe['Id'].tolist()[:3] == ['001', '001', '003']
+
+def test_read_csv_schema_with_dtype_error(file_frame, csv_path):
+    # a dtype for all the columns can't be combined with the schema
+    with raises_containing(expected_exception=ValueError, message="Error:  A schema can't be combined with dtype=<class 'str'>"):
+        file_frame.read_csv(file_path=csv_path, schema={'Id': 'string'}, dtype=str)
+
+def test_read_csv_chunksize(file_frame, csv_path):
+    # initialize and add a primary key constraint on the city column and a default value constraint on the name column
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['City']))
+    file_frame.add_constraint(constraint_func=file_frame.constraint_default_value(column_name='Name', default_value='Unknown'))
+    # read the csv file in chunks of 3 rows - the chunks are concatenated into one dataframe
+    file_frame.read_csv(file_path=csv_path, chunksize=3)
+    assert file_frame.dataframe.shape[0] == 4
+    assert file_frame.dataframe.index.tolist() == [0, 1, 2, 3]
+    assert file_frame.dataframe['Name'].tolist() == ['Alice', 'Unknown', 'Charlie', 'David']
+
+def test_read_csv_lazy(file_frame, csv_path):
+    # initialize and add a primary key constraint on the code column - the code column has duplicate values
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['Code']))
+    # the file isn't read until it is validated or the dataframe is used
+    file_frame.read_csv_lazy(file_path=csv_path, dtype={'Code': 'string'})
+    with raises_containing(expected_exception=ValueError, message="Error:  PRIMARY KEY Constraint:  ['Code'] cannot have duplicate values."):
+        file_frame.validate_constraints()
+    # remove the constraint - the whole file is read the first time the dataframe is used
+    file_frame.remove_constraint(constraint_func=file_frame.constraints[0])
+    assert file_frame.column_names() == list(data.keys())
+    assert file_frame.dataframe.shape == (4, len(data))
+
+def test_read_csv_lazy_repr(file_frame, csv_path):
+    # initialize and add a primary key constraint on the code column - the code column has duplicate values
+    file_frame.add_constraint(constraint_func=file_frame.constraint_primary_key(column_names=['Code']))
+    # the repr of a pending read doesn't read or validate the file
+    file_frame.read_csv_lazy(file_path=csv_path)
+    assert repr(file_frame) == f"FileFrame(pending read of {csv_path!r})"
+
+def test_read_csv_lazy_missing_file(file_frame, tmp_path):
+    # build the dataframe and then defer reading a file that doesn't exist
+    file_frame.read_dict(data_dict={'Old': [1, 2]})
+    file_frame.read_csv_lazy(file_path=tmp_path / 'missing.csv')
+    # the read fails every time the dataframe is used, the previous dataframe is never returned in its place
+    for _ in range(2):
+        with pytest.raises(expected_exception=FileNotFoundError):
+            file_frame.dataframe
+
+def test_read_csv_lazy_custom_constraint(file_frame, csv_path):
+    # add a custom constraint function that isn't on a column next to a not null constraint on the city column
+    def custom_constraint(dataframe):
+        pass
+    file_frame.add_constraint(constraint_func=file_frame.constraint_not_null(column_name='City'))
+    file_frame.add_constraint(constraint_func=custom_constraint)
+    file_frame.read_csv_lazy(file_path=csv_path)
+    file_frame.validate_constraints()
+
+def test_read_csv_chunksize_duplicate_across_chunks_error(file_frame, csv_path):
+    # initialize and add a unique constraint on the test3 column
+    file_frame.add_constraint(constraint_func=file_frame.constraint_unique(column_names=['Test3']))
+    with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['Test3'] cannot have duplicate values."):
+        # read the csv file in chunks of 1 row, so the duplicate values in the test3 column are in different chunks
+        file_frame.read_csv(file_path=csv_path, chunksize=1)
+
+@pytest.mark.parametrize(
+    'text, chunksize, has_duplicates', [
+        # the first chunk is parsed as int64 and the second as float64 because of its missing value
+        ('A,B\n1,a\n2,b\n,c\n1,d\n', 2, True),
+        # the whole column is strings, so 1 and 1.0 aren't duplicates even though they are in int64 and float64 chunks
+        ('A,B\n1,a\na,b\n1.0,c\n', 1, False),
+        # the whole column is strings, so the '1' values are duplicates even though the second is in an int64 chunk
+        ('A,B\na,a\n1,b\n,c\n-0.0,d\n1,e\n', 2, True),
+    ],
+)
+def test_read_csv_chunksize_across_chunk_datatypes(file_frame, tmp_path, text, chunksize, has_duplicates):
+    # write the data to a csv file - pandas infers different datatypes for the A column of the chunks
+    file_path = tmp_path / 'data.csv'
+    file_path.write_text(text)
+    # initialize and add a unique constraint on the A column
+    file_frame.add_constraint(constraint_func=file_frame.constraint_unique(column_names=['A']))
+    if has_duplicates:
+        with raises_containing(expected_exception=ValueError, message="Error:  UNIQUE Constraint:  ['A'] cannot have duplicate values."):
+            file_frame.read_csv(file_path=file_path, chunksize=chunksize)
+        return
+    # the chunked read gives the key column the datatype of a read of the whole file
+    file_frame.read_csv(file_path=file_path, chunksize=chunksize)
+    pd.testing.assert_frame_equal(file_frame.dataframe, pd.read_csv(file_path))
+
+def test_read_fwf(patched_readers):
     # initialize the custom dataframe
     custom_dataframe = FileFrame()
     # initialize the constraint to test the validate constraints method call
@@ -272,32 +754,62 @@ def test_read_fwf(mock_dataframe):
     # add the constraint to the dataframe
     custom_dataframe.add_constraint(constraint_func=constraint_1)
     # mock pandas.read_fwf
-    with patch("pandas.read_fwf", return_value=mock_dataframe) as mock_read_fwf:
-        with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  NOT NULL Constraint:  A cannot have null values.")):
-            # test that a not null constraint is raised to test the validate constraint method call
-            custom_dataframe.read_fwf(file_path="fake_path.txt", colspecs=[(0, 5), (6, 10)])
-            # test pandas.read_fwf is called
-            mock_read_fwf.assert_called_once_with("fake_path.txt", colspecs=[(0, 5), (6, 10)])
-            # test dataframe equality
-            pd.testing.assert_frame_equal(custom_dataframe.dataframe, mock_dataframe)
-
-def test_read_dict(custom_dataframe):
+    mock_read_fwf = patched_readers['read_fwf']
+    with raises_containing(expected_exception=ValueError, message="Error:  NOT NULL Constraint:  A cannot have null values."):
+        # test that a not null constraint is raised to test the validate constraint method call
+        custom_dataframe.read_fwf(file_path="fake_path.txt", colspecs=[(0, 5), (6, 10)])
+    # test pandas.read_fwf is called
+    mock_read_fwf.assert_called_once_with("fake_path.txt", colspecs=[(0, 5), (6, 10)])
+    # test dataframe equality
+    pd.testing.assert_frame_equal(custom_dataframe.dataframe, _CACHED_DF)
+
+def test_read_dict(file_frame):
     # initialize the constraint to test the validate constraints method call
-    constraint1 = custom_dataframe.constraint_not_null(column_name='Id')
+    constraint1 = file_frame.constraint_not_null(column_name='Id')
     # add the constraint to the dataframe
-    custom_dataframe.add_constraint(constraint_func=constraint1)
-    with pytest.raises(expected_exception=ValueError, match=re.escape("Error:  NOT NULL Constraint:  Id cannot have null values.")):
+    file_frame.add_constraint(constraint_func=constraint1)
+    with raises_containing(expected_exception=ValueError, message="Error:  NOT NULL Constraint:  Id cannot have null values."):
         # test that a not null constraint is raised to test the validate constraint method call
-        custom_dataframe.read_dict(data_dict=data)
+        file_frame.read_dict(data_dict=data)
         # test dataframe equality
-        pd.testing.assert_frame_equal(custom_dataframe.dataframe, pd.DataFrame(data))
+        pd.testing.assert_frame_equal(file_frame.dataframe, pd.DataFrame(data))
 
 def test_column_names(custom_dataframe):
-    custom_dataframe.read_dict(data_dict=data)
     column_names = custom_dataframe.column_names()
     assert isinstance(column_names, list)
 
 def test_column_datatypes(custom_dataframe):
-    custom_dataframe.read_dict(data_dict=data)
     column_datatypes = custom_dataframe.column_datatypes()
-    assert isinstance(column_datatypes, dict)
\ No newline at end of file
+    assert isinstance(column_datatypes, dict)
+
+def test_column_names_after_new_read(file_frame):
+    # build the dataframe and get the column names and datatypes
+    file_frame.read_dict(data_dict=data)
+    assert file_frame.column_names() == list(data.keys())
+    assert file_frame.column_datatypes()['Age'] == 'int64'
+    # read a dataframe with different columns - the column names and datatypes are of the new dataframe
+    file_frame.read_dict(data_dict={'Age': ['25'], 'Other': [1.5]})
+    assert file_frame.column_names() == ['Age', 'Other']
+    assert file_frame.column_datatypes() == {'Age': 'object', 'Other': 'float64'}
+
+def test_has_nulls_after_new_read(file_frame):
+    # build the dataframe - the id column has a null value and the age column doesn't
+    file_frame.read_dict(data_dict=data)
+    assert file_frame.has_nulls(column_name='Id')
+    assert not file_frame.has_nulls(column_name='Age')
+    # read a dataframe without null ids - the result is of the new dataframe
+    file_frame.read_dict(data_dict={'Id': ['001'], 'Age': [None]})
+    assert not file_frame.has_nulls(column_name='Id')
+    assert file_frame.has_nulls(column_name='Age')
+
+def test_results_after_dataframe_changed(file_frame):
+    # build the dataframe without duplicates or null values
+    file_frame.read_dict(data_dict={'A': [1, 2, 3]})
+    assert file_frame.find_duplicate_records(column_names=['A']).empty
+    assert not file_frame.has_nulls(column_name='A')
+    # change the dataframe in place - the results are of the changed dataframe
+    file_frame.dataframe.loc[2, 'A'] = 1
+    file_frame.dataframe['B'] = [None, 'b', 'c']
+    assert len(file_frame.find_duplicate_records(column_names=['A'])) == 1
+    assert file_frame.has_nulls(column_name='B')
+    assert file_frame.column_names() == ['A', 'B']